@@ -19,9 +19,10 @@ IMPLEMENTATION:
 
 import sys
 import random
+import bisect
 import json
-import math
 import os
+import weakref
 from datetime import datetime, date
 from typing import List, Tuple, Set, Optional, Dict, Any
 try:
@@ -30,14 +31,19 @@ try:
 except ImportError:
     ICON_GENERATION_AVAILABLE = False
     print("Warning: Icon generation not available. Install Pillow for icon support.")
+try:
+    import orjson  # Optional fast JSON export
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, 
     QPushButton, QLabel, QSpinBox, QLineEdit, QFrame, QSizePolicy,
     QApplication, QPlainTextEdit, QSplitter, QTabWidget, QDateEdit,
     QTextEdit, QGroupBox, QFormLayout, QComboBox, QCheckBox
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QDate
-from PyQt5.QtGui import QPainter, QColor, QPen, QFont, QPixmap, QBrush, QKeySequence, QFontDatabase
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QDate, QLineF, QRect, QSignalBlocker, QEvent
+from PyQt5.QtGui import QPainter, QColor, QPen, QFont, QPixmap, QBrush, QKeySequence, QFontDatabase, QStandardItemModel, QStandardItem, QPixmapCache
 
 # Import GATE CREATOR and gate portal modules
 try:
@@ -79,6 +85,401 @@ SECONDARY_ACCENT = "#667eea"
 DREAM_MECHA_FONT = "NCL Razor Demo"  # This will be the loaded font name
 FALLBACK_FONTS = "'Consolas', 'Monaco', 'Courier New', monospace"
 
+# Display font shared by reference across widgets instead of a per-sheet font-family.
+# Built on first use because a QFont needs the QApplication to exist.
+_DREAM_MECHA_QFONT = None
+
+
+def _dream_mecha_font() -> QFont:
+    """Shared Dream Mecha font; QSS font-size/weight still apply on top"""
+    global _DREAM_MECHA_QFONT
+    if _DREAM_MECHA_QFONT is None:
+        font = QFont(DREAM_MECHA_FONT)
+        font.setStyleHint(QFont.SansSerif)
+        _DREAM_MECHA_QFONT = font
+    return _DREAM_MECHA_QFONT
+
+
+# Shared Dream Mecha panel stylesheets, built once at import
+_GROUPBOX_QSS = f"""
+    QGroupBox {{
+        background: {UPGRADE_BG};
+        border: 2px solid {BORDER_COLOR};
+        border-radius: 5px;
+        padding: 10px;
+        font-weight: bold;
+        color: {TEXT_COLOR};
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        color: {GOLD};
+    }}
+"""
+_SPINBOX_QSS = f"""
+    QSpinBox {{
+        background: {TAB_BG};
+        border: 1px solid {BORDER_COLOR};
+        border-radius: 3px;
+        padding: 5px;
+        color: {TEXT_COLOR};
+        min-width: 80px;
+    }}
+"""
+_SECONDARY_BUTTON_QSS = f"""
+    QPushButton {{ 
+        background: {SECONDARY_ACCENT}; 
+        color: #fff; 
+        border: none; 
+        border-radius: 5px; 
+        padding: 10px 16px; 
+        font-weight: bold; 
+    }}
+    QPushButton:hover {{ background: #8ea6f8; }}
+    QPushButton:pressed {{ background: #5c6bc0; }}
+"""
+_PREVIEW_TEXTEDIT_QSS = f"""
+    QTextEdit {{
+        background: {TAB_BG};
+        border: 1px solid {BORDER_COLOR};
+        border-radius: 3px;
+        padding: 5px;
+        color: {TEXT_COLOR};
+        font-size: 11px;
+    }}
+"""
+_GOLD_BUTTON_QSS = f"""
+    QPushButton {{
+        background: {GOLD};
+        color: #000000;
+        border: none;
+        border-radius: 5px;
+        padding: 12px 20px;
+        font-weight: bold;
+        font-size: 14px;
+    }}
+    QPushButton:hover {{ background: #ffd700; }}
+    QPushButton:pressed {{ background: #e6c200; }}
+"""
+_SPLITTER_QSS = f"""
+    QSplitter::handle {{
+        background: {BORDER_COLOR};
+        border-radius: 1px;
+    }}
+"""
+_PANEL_FRAME_QSS = f"""
+    QFrame {{
+        background: {UPGRADE_BG};
+        border: 1px solid {BORDER_COLOR};
+        border-radius: 5px;
+        padding: 10px;
+    }}
+"""
+_LOG_FRAME_QSS = f"""
+    QFrame {{
+        background: {UPGRADE_BG};
+        border: 1px solid {BORDER_COLOR};
+        border-radius: 3px;
+        padding: 5px;
+    }}
+"""
+
+# Blockmaker action buttons; the press highlight is appended once here
+# instead of round-tripping each button's styleSheet() at build time
+_BUTTON_FEEDBACK_QSS = """
+    QPushButton:pressed {
+        background: #fffbe6;
+        color: #222;
+        border: 2px solid #f7c873;
+    }
+"""
+_CREATE_BUTTON_QSS = f"""
+    QPushButton {{ background: {GOLD}; color: #000000; border: none; border-radius: 5px; padding: 8px 16px; font-weight: bold; font-family: 'Segoe UI', Arial, sans-serif; }}
+    QPushButton:hover {{ background: #ffd700; }}
+    QPushButton:pressed {{ background: #e6c200; }}
+""" + _BUTTON_FEEDBACK_QSS
+_TOOL_BUTTON_QSS = f"""
+    QPushButton {{ background: {SECONDARY_ACCENT}; color: #fff; border: none; border-radius: 5px; padding: 8px 16px; font-weight: bold; font-family: 'Segoe UI', Arial, sans-serif; }}
+    QPushButton:hover {{ background: #8ea6f8; }}
+    QPushButton:pressed {{ background: #5c6bc0; }}
+""" + _BUTTON_FEEDBACK_QSS
+_CLEAR_BUTTON_QSS = f"""
+    QPushButton {{ background: {BORDER_COLOR}; color: {TEXT_COLOR}; border: none; border-radius: 5px; padding: 8px 16px; font-weight: bold; font-family: 'Segoe UI', Arial, sans-serif; }}
+    QPushButton:hover {{ background: #4a5568; }}
+""" + _BUTTON_FEEDBACK_QSS
+
+# GATE tab widgets
+_GATE_BUTTON_QSS = f"""
+    QPushButton {{
+        background: {GOLD};
+        color: #000000;
+        border: none;
+        border-radius: 5px;
+        padding: 12px 24px;
+        font-weight: bold;
+        font-size: 14px;
+    }}
+    QPushButton:hover {{
+        background: #ffd700;
+    }}
+"""
+_COMPACT_SECONDARY_BUTTON_QSS = f"""
+    QPushButton {{
+        background: {SECONDARY_ACCENT};
+        color: #fff;
+        border: none;
+        border-radius: 5px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        background: #8ea6f8;
+    }}
+"""
+_GATE_TEXTEDIT_QSS = f"""
+    QTextEdit {{
+        background: {TAB_BG};
+        border: 2px solid {BORDER_COLOR};
+        border-radius: 5px;
+        padding: 10px;
+        color: {TEXT_COLOR};
+        font-size: 11px;
+    }}
+"""
+
+
+def _role_qss(qss: str, widget_class: str, role: str, target_class: Optional[str] = None) -> str:
+    """Scope a widget stylesheet to widgets carrying the given role property,
+    optionally retargeting its selectors at another widget class"""
+    return qss.replace(widget_class, f'{target_class or widget_class}[role="{role}"]')
+
+
+# One sheet for the whole main window; widgets opt in via setProperty("role", ...).
+# Frames and group boxes keep per-widget sheets because their rules are meant
+# to cascade onto nested QFrame subclasses such as labels.
+_WINDOW_QSS = "".join((
+    f"""
+    QMainWindow {{
+        background: {TAB_BG};
+        color: {TEXT_COLOR};
+    }}
+""",
+    _role_qss(_SPLITTER_QSS, "QSplitter", "panel"),
+    _role_qss(_SPINBOX_QSS, "QSpinBox", "panel"),
+    _role_qss(_CREATE_BUTTON_QSS, "QPushButton", "create"),
+    _role_qss(_TOOL_BUTTON_QSS, "QPushButton", "tool"),
+    _role_qss(_CLEAR_BUTTON_QSS, "QPushButton", "clear"),
+    _role_qss(_GOLD_BUTTON_QSS, "QPushButton", "gold"),
+    _role_qss(_GATE_BUTTON_QSS, "QPushButton", "gate"),
+    _role_qss(_COMPACT_SECONDARY_BUTTON_QSS, "QPushButton", "secondary"),
+    _role_qss(_PREVIEW_TEXTEDIT_QSS, "QTextEdit", "preview", "QPlainTextEdit"),
+    _role_qss(_GATE_TEXTEDIT_QSS, "QTextEdit", "gate"),
+))
+
+# Memoized ASCII tokens for block numbers, filled on first use
+_BLOCK_TOKEN_CACHE = {-999: ". ", 1: "+ "}  # -999 is the flash value, shown as empty
+
+
+def _format_block_token(block_num: int) -> str:
+    """Return the padded ASCII pattern token for a block number"""
+    token = _BLOCK_TOKEN_CACHE.get(block_num)
+    if token is None:
+        token = _BLOCK_TOKEN_CACHE[block_num] = f"{block_num} "
+    return token
+
+
+def _clean_block_token(block_num: int) -> str:
+    """Return the unpadded token used by the header-less export pattern"""
+    if block_num == -999:
+        return "."  # treat flash as empty
+    if block_num == 1:
+        return "+"
+    return str(block_num)
+
+
+def _pattern_rows(blocks: Dict[Tuple[int, int], int], format_token=_format_block_token, empty: str = ". ") -> List[str]:
+    """Render the bounding box of a blocks dict as right-stripped text rows"""
+    # One pass splits the coordinates; min/max then run over flat tuples in C
+    rows_used, cols_used = zip(*blocks)
+    min_row, max_row = min(rows_used), max(rows_used)
+    min_col, max_col = min(cols_used), max(cols_used)
+    
+    # Preallocate the box as empty cells, then scatter the blocks into it -
+    # one pass over the blocks instead of a lookup per cell
+    width = max_col - min_col + 1
+    rows = [[empty] * width for _ in range(max_row - min_row + 1)]
+    for (row, col), block_num in blocks.items():
+        rows[row - min_row][col - min_col] = format_token(block_num)
+    return ["".join(cells).rstrip() for cells in rows]
+
+
+# Bound RNG methods for the piece generation hot paths (skips the module attribute lookup)
+_rand = random.random
+_choice = random.choice
+
+# Weighted stat roll for random pieces: 40% HP, 25% Attack, 20% Defense, 15% Speed
+_STAT_TYPES = ("hp", "attack", "defense", "speed")
+_STAT_CUM_WEIGHTS = (0.4, 0.65, 0.85, 1.0)
+
+# Game rules exponential scaling for pieces, tabulated for every block count a 12x12 grid allows
+_PIECE_BASE_HP = 100
+_PIECE_STAT_SCALING = 1.6
+_PIECE_BASE_COST = 100
+_PIECE_PRICE_SCALING = 1.8
+_STAT_POWER_TABLE = [int(_PIECE_BASE_HP * (n ** _PIECE_STAT_SCALING)) for n in range(145)]
+_BLOCK_PRICE_TABLE = [int(_PIECE_BASE_COST * (n ** _PIECE_PRICE_SCALING)) for n in range(145)]
+
+# Rarity by block count: <=5 common, <=15 uncommon, <=25 rare, else legendary
+_RARITY_MAX_BLOCKS = (5, 15, 25)
+_RARITY_LEVELS = ("common", "uncommon", "rare", "legendary")
+
+# Threat by total power (hp + att): <50k low, <150k moderate, <500k high, else extreme
+_THREAT_POWER_THRESHOLDS = (50000, 150000, 500000)
+_THREAT_LEVELS = ("low", "moderate", "high", "extreme")
+
+# Simplified enemy descriptor system for now, indexed by tier - 1
+_SIZE_DESCRIPTOR_TIERS = (
+    ("small", "tiny", "diminutive"),
+    ("hulking", "large", "imposing"),
+    ("colossal", "gigantic", "enormous"),
+    ("world-ending", "cosmic", "reality-bending"),
+)
+_THREAT_DESCRIPTOR_TIERS = (
+    ("with gnashing teeth", "sporting sharp claws"),
+    ("bristling with razor spikes", "wreathed in shadow flames"),
+    ("channeling destructive force", "emanating reality-warping power"),
+    ("radiating universe-ending power", "bending space-time"),
+)
+
+# Byte translation table for pattern_to_array: '+' -> 1, '0'-'9' -> digit value, else 0
+_PATTERN_CELL_TABLE = bytes(
+    1 if byte == ord('+') else byte - ord('0') if ord('0') <= byte <= ord('9') else 0
+    for byte in range(256)
+)
+
+# Fallback piece patterns indexed by block count (0 means "none or fewer"), larger counts use the last
+_FALLBACK_PATTERNS = (
+    "+ ",
+    "+",
+    "+ 2",
+    "+ 2\n3 .",
+    "+ 2\n3 4",
+    "+ 2\n3 4\n5 .",
+    "+ 2\n3 4\n5 6",
+    "+ 2\n3 4\n5 6\n7 .",
+    "+ 2\n3 4\n5 6\n7 8",
+)
+
+# Stat name -> abbreviated key used in piece data
+_STAT_KEYS = {"hp": "hp", "attack": "att", "defense": "def", "speed": "spd"}
+
+# 4-neighbour offsets: N, S, W, E
+_DIRS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def _find_active_stat(stats: Dict[str, int]) -> Optional[Tuple[str, int]]:
+    """Return (NAME, value) for the first non-zero stat of a piece, or None"""
+    return next(((name.upper(), value) for name, value in stats.items() if value > 0), None)
+
+
+# Per grid size: (all cells, cells not in the first column, cells not in the last column),
+# as ints with one 0x01 byte per cell so they line up with int.from_bytes(occupied)
+_FRONTIER_MASKS = {}
+
+
+def _frontier_masks(grid_size: int) -> Tuple[int, int, int]:
+    """Cell masks used by _compute_frontier, built once per grid size"""
+    masks = _FRONTIER_MASKS.get(grid_size)
+    if masks is None:
+        row_all = b"\x01" * grid_size
+        row_not_first = b"\x00" + b"\x01" * (grid_size - 1)
+        row_not_last = b"\x01" * (grid_size - 1) + b"\x00"
+        masks = _FRONTIER_MASKS[grid_size] = tuple(
+            int.from_bytes(row * grid_size, "little") for row in (row_all, row_not_first, row_not_last)
+        )
+    return masks
+
+
+def _compute_frontier(occupied: bytearray, grid_size: int) -> List[Tuple[int, int]]:
+    """Return empty cells 4-adjacent to an occupied cell in a row-major occupancy bitmap"""
+    # Treat the bitmap as one big int and shift it a cell (8 bits) or a row in
+    # each direction, so all cells are tested in a handful of int operations
+    all_cells, not_first_col, not_last_col = _frontier_masks(grid_size)
+    occ = int.from_bytes(occupied, "little")
+    row_shift = 8 * grid_size
+    neighbours = (((occ << 8) & not_first_col) | ((occ >> 8) & not_last_col) |
+                  (occ << row_shift) | (occ >> row_shift))
+    valid = neighbours & all_cells & ~occ
+    
+    # Walk only the set cells, lowest index first
+    frontier = []
+    while valid:
+        low = valid & -valid
+        frontier.append(divmod((low.bit_length() - 1) >> 3, grid_size))
+        valid ^= low
+    return frontier
+
+
+# Stars mirror rule: project a position onto the grid edge in a compass direction
+_MIRROR = {
+    'N': lambda row, col, grid_size: (0, col),              # Top of grid
+    'S': lambda row, col, grid_size: (grid_size - 1, col),  # Bottom of grid
+    'E': lambda row, col, grid_size: (row, grid_size - 1),  # Right of grid
+    'W': lambda row, col, grid_size: (row, 0),              # Left of grid
+}
+
+# Glyph geometry depends only on the grid size, so each piece is computed once
+_GLYPH_PERIMETERS = {}  # grid_size -> perimeter walk
+_GLYPH_RINGS = {}  # (grid_size, radius) -> left-half ring cells
+
+
+def _glyph_perimeter(grid_size: int) -> Tuple[Tuple[int, int], ...]:
+    """Perimeter cells in clockwise order, starting at the top-left corner"""
+    perimeter = _GLYPH_PERIMETERS.get(grid_size)
+    if perimeter is None:
+        positions = []
+        
+        # Top row (left to right)
+        for col in range(grid_size):
+            positions.append((0, col))
+        
+        # Right column (top to bottom, excluding corners)
+        for row in range(1, grid_size - 1):
+            positions.append((row, grid_size - 1))
+        
+        # Bottom row (right to left, excluding corners)
+        for col in range(grid_size - 1, -1, -1):
+            positions.append((grid_size - 1, col))
+        
+        # Left column (bottom to top, excluding corners)
+        for row in range(grid_size - 2, 0, -1):
+            positions.append((row, 0))
+        perimeter = _GLYPH_PERIMETERS[grid_size] = tuple(positions)
+    return perimeter
+
+
+def _glyph_ring(grid_size: int, radius: int) -> Tuple[Tuple[int, int], ...]:
+    """Interior cells at a Manhattan distance from the centre, left half only (the right half is mirrored)"""
+    key = (grid_size, radius)
+    ring = _GLYPH_RINGS.get(key)
+    if ring is None:
+        center_row = grid_size // 2
+        center_col = grid_size // 2
+        positions = []
+        for row in range(1, grid_size-1):
+            # Left half of the diamond has exactly one cell per row within reach
+            # of the centre; the right half is mirrored by the caller
+            col = center_col - (radius - abs(row - center_row))
+            if 1 <= col <= center_col:
+                positions.append((row, col))
+        ring = _GLYPH_RINGS[key] = tuple(positions)
+    return ring
+
+
+# Symbols offered for GATE portal codes (and picked from by the random-symbol buttons)
+_PORTAL_SYMBOLS = ('!', '@', '#', '$', '%', '^', '&', '*', '(', ')', '_', '+', '-', '=', '[', ']', '{', '}', '|', ';', ':', ',', '.', '<', '>', '?', '/', '~', '`', '"', "'", '\\')
+
 
 class BlockmakerGrid(QWidget):
     """Grid widget for block placement and visualization"""
@@ -88,16 +489,47 @@ class BlockmakerGrid(QWidget):
         self.grid_size = grid_size
         self.cell_size = 24  # Match upgrade grid block size
         self.blocks = {}  # (row, col) -> block_number
+        self.occupied = bytearray(grid_size * grid_size)  # Row-major occupancy bitmap mirroring blocks
         self.valid_positions = set()  # Valid positions for next block
+        self._valid_list = []  # Same positions in a flat list for O(1) random picks
+        self._valid_index = {}  # pos -> index in _valid_list, for swap-remove
         self.hover_pos = None  # Current hover position
         self.dragging = False  # Track if we're dragging
         self.drag_start_pos = None  # Starting position for drag
         self._drag_visited = set()  # Track cells filled in current drag
-        self._processing_positions = set()  # Track positions currently being processed
+        self._processing_cells = bytearray(grid_size * grid_size)  # Cells with a placement request in flight
+        self._last_cell = None  # Raw (row, col) under the cursor at the last mouse move
         
         # Initialize valid positions for first block
         self.update_valid_positions()
         
+        # Static paint resources - grid geometry never changes after construction
+        extent = 10 + grid_size * self.cell_size
+        self._grid_lines = []
+        for i in range(grid_size + 1):
+            offset = 10 + i * self.cell_size
+            self._grid_lines.append(QLineF(10, offset, extent, offset))  # Horizontal
+            self._grid_lines.append(QLineF(offset, 10, offset, extent))  # Vertical
+        self._grid_pen = QPen(QColor(BORDER_COLOR), 1)
+        self._bg_color = QColor(UPGRADE_BG)
+        self._block_font = QFont()  # Terminal-like font for block numbers
+        self._block_font.setFamily("Consolas, Monaco, 'Courier New', monospace")
+        self._block_font.setPointSize(9)
+        self._block_font.setBold(True)
+        self._block_font.setFixedPitch(True)
+        self._gold_brush = QBrush(QColor(GOLD))
+        self._flash_brush = QBrush(QColor("#fffbe6"))
+        self._border_pen = QPen(QColor(BORDER_COLOR), 2)
+        self._text_pen = QPen(QColor("#000000"))
+        self._dash_pen = QPen(QColor(GOLD), 2, Qt.DashLine)
+        self._no_brush = QBrush()
+        self._hover_brush = QBrush(QColor(247, 200, 115, 77))  # GOLD at 30% alpha
+        self._hover_pen = QPen(QColor(0, 0, 0, 77))  # Default pen at 30% alpha
+        self._blocks_pixmap = None  # Cached background + grid lines + blocks + valid positions layer
+        self._blocks_dirty = True  # Set whenever blocks (and so valid positions) change
+        self.blocks_version = 0  # Bumped on every block change; lets callers cache derived text
+        self._flash_cells = set()  # Blocks currently showing the placement flash, drawn over the layer
+        
         # Setup UI
         self.setMinimumSize(
             grid_size * self.cell_size + 20, 
@@ -118,57 +550,113 @@ class BlockmakerGrid(QWidget):
         
     def paintEvent(self, event):
         """Draw the grid and blocks"""
+        if self._blocks_dirty or self._blocks_pixmap is None:
+            self._render_blocks_layer()
+        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
+        # Blit background, grid lines, blocks and valid positions in one go -
+        # spontaneous repaints (expose, focus) cost nothing more than this
+        painter.drawPixmap(0, 0, self._blocks_pixmap)
+        
+        # Placement flashes sit on top so they never invalidate the layer
+        for pos in self._flash_cells:
+            if pos in self.blocks:
+                self.draw_block(painter, pos, -999)
+        
+        # Draw hover effect
+        if self.hover_pos and self.hover_pos in self.valid_positions:
+            self.draw_hover_effect(painter, self.hover_pos)
+    
+    def _render_blocks_layer(self):
+        """Rebuild the cached background, grid line, block and valid position layer"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)  # Stay sharp on HiDPI screens
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
         # Fill background
-        painter.fillRect(self.rect(), QColor(UPGRADE_BG))
+        painter.fillRect(self.rect(), self._bg_color)
         
         # Draw grid lines (only within the grid, no extra lines)
-        painter.setPen(QPen(QColor(BORDER_COLOR), 1))
-        for i in range(self.grid_size + 1):
-            x = i * self.cell_size + 10
-            y = i * self.cell_size + 10
-            # Only draw lines within the grid area
-            painter.drawLine(10, y, 10 + self.grid_size * self.cell_size, y)
-            painter.drawLine(x, 10, x, 10 + self.grid_size * self.cell_size)
+        painter.setPen(self._grid_pen)
+        painter.drawLines(self._grid_lines)
         
         # Draw blocks
         for pos, block_num in self.blocks.items():
             self.draw_block(painter, pos, block_num)
         
-        # Draw valid positions
+        # Draw valid positions - these only change alongside the blocks
         for pos in self.valid_positions:
             self.draw_valid_position(painter, pos)
+        painter.end()
         
-        # Draw hover effect
-        if self.hover_pos and self.hover_pos in self.valid_positions:
-            self.draw_hover_effect(painter, self.hover_pos)
+        self._blocks_pixmap = pixmap
+        self._blocks_dirty = False
+    
+    def resizeEvent(self, event):
+        """Drop the cached block layer when the widget size changes"""
+        self._blocks_dirty = True
+        super().resizeEvent(event)
+    
+    def _cell_rect(self, pos: Tuple[int, int]) -> QRect:
+        """Widget-space rectangle covering a grid cell"""
+        row, col = pos
+        return QRect(col * self.cell_size + 10, row * self.cell_size + 10, self.cell_size, self.cell_size)
+    
+    def invalidate_blocks(self):
+        """Mark the cached block layer stale and schedule a repaint"""
+        self._blocks_dirty = True
+        self.blocks_version += 1
+        self.update()
+    
+    def flash_cell(self, pos: Tuple[int, int], duration: int = 200):
+        """Briefly highlight a placed block, repainting only its cell"""
+        rect = self._cell_rect(pos)
+        self._flash_cells.add(pos)
+        self.update(rect)
+        
+        def restore():
+            self._flash_cells.discard(pos)
+            self.update(rect)
+        QTimer.singleShot(duration, restore)
     
     def draw_block(self, painter: QPainter, pos: Tuple[int, int], block_num: int):
         """Draw a numbered block"""
         row, col = pos
-        x = col * self.cell_size + 11
-        y = row * self.cell_size + 11
+        tile = self._block_tile(block_num, painter.device().devicePixelRatioF())
+        painter.drawPixmap(col * self.cell_size + 10, row * self.cell_size + 10, tile)
+    
+    def _block_tile(self, block_num: int, ratio: float) -> QPixmap:
+        """Rendered block face for a number, shared across grids through QPixmapCache"""
+        key = f"blockmaker_block_{block_num}_{self.cell_size}_{ratio}"
+        tile = QPixmapCache.find(key)
+        if tile is not None:
+            return tile
+        
+        # The tile spans the whole cell so the 2px border fits around the face
+        tile = QPixmap(int(self.cell_size * ratio), int(self.cell_size * ratio))
+        tile.setDevicePixelRatio(ratio)
+        tile.fill(Qt.transparent)
+        painter = QPainter(tile)
+        painter.setRenderHint(QPainter.Antialiasing)
         width = self.cell_size - 2
         height = self.cell_size - 2
         
         # Block background
         if block_num == -999:
-            painter.setBrush(QColor("#fffbe6"))
+            painter.setBrush(self._flash_brush)
         else:
-            painter.setBrush(QColor(GOLD))
-        painter.setPen(QPen(QColor(BORDER_COLOR), 2))
-        painter.drawRoundedRect(x, y, width, height, 3, 3)
+            painter.setBrush(self._gold_brush)
+        painter.setPen(self._border_pen)
+        painter.drawRoundedRect(1, 1, width, height, 3, 3)
         
         # Block number text - use terminal-like font
-        painter.setPen(QColor("#000000"))
-        font = QFont()
-        font.setFamily("Consolas, Monaco, 'Courier New', monospace")
-        font.setPointSize(9)
-        font.setBold(True)
-        font.setFixedPitch(True)
-        painter.setFont(font)
+        painter.setPen(self._text_pen)
+        painter.setFont(self._block_font)
         
         # Format block number
         if block_num == 1:
@@ -177,12 +665,16 @@ class BlockmakerGrid(QWidget):
             text = ""
         else:
             text = str(block_num)
-        
-        # Center text
         text_rect = painter.fontMetrics().boundingRect(text)
-        text_x = x + (width - text_rect.width()) // 2
-        text_y = y + (height + text_rect.height()) // 2 - 2
-        painter.drawText(text_x, text_y, text)
+        painter.drawText(
+            1 + (width - text_rect.width()) // 2,
+            1 + (height + text_rect.height()) // 2 - 2,
+            text
+        )
+        painter.end()
+        
+        QPixmapCache.insert(key, tile)
+        return tile
     
     def draw_valid_position(self, painter: QPainter, pos: Tuple[int, int]):
         """Draw a valid placement position"""
@@ -193,9 +685,8 @@ class BlockmakerGrid(QWidget):
         height = self.cell_size - 2
         
         # Dashed border for valid positions
-        pen = QPen(QColor(GOLD), 2, Qt.DashLine)
-        painter.setPen(pen)
-        painter.setBrush(QBrush())
+        painter.setPen(self._dash_pen)
+        painter.setBrush(self._no_brush)
         painter.drawRoundedRect(x, y, width, height, 3, 3)
     
     def draw_hover_effect(self, painter: QPainter, pos: Tuple[int, int]):
@@ -206,38 +697,48 @@ class BlockmakerGrid(QWidget):
         width = self.cell_size - 2
         height = self.cell_size - 2
         
-        # Semi-transparent highlight
-        painter.setBrush(QColor(GOLD))
-        painter.setPen(QPen())
-        painter.setOpacity(0.3)
+        # Semi-transparent highlight - alpha baked into the colours, no opacity state change
+        painter.setBrush(self._hover_brush)
+        painter.setPen(self._hover_pen)
         painter.drawRoundedRect(x, y, width, height, 3, 3)
-        painter.setOpacity(1.0)
     
     def mousePressEvent(self, event):
         """Handle mouse clicks for block placement"""
         if event.button() == Qt.LeftButton:
             pos = self.get_grid_position(event.pos())
-            if pos in self.valid_positions and pos not in self._processing_positions:
+            if pos in self.valid_positions and not self._processing_cells[pos[0] * self.grid_size + pos[1]]:
                 self.dragging = True
                 self.drag_start_pos = pos
                 self._drag_visited = set()
-                self._processing_positions = set()
+                self._processing_cells[:] = bytes(len(self._processing_cells))
                 self._drag_visited.add(pos)
-                self._processing_positions.add(pos)
+                self._processing_cells[pos[0] * self.grid_size + pos[1]] = 1
                 self.place_block_requested.emit(pos)
     
     def mouseMoveEvent(self, event):
         """Handle mouse movement for hover effects and drag placement"""
-        pos = self.get_grid_position(event.pos())
+        # Nothing to do until the cursor crosses into another cell
+        point = event.pos()
+        cell = ((point.y() - 10) // self.cell_size, (point.x() - 10) // self.cell_size)
+        if cell == self._last_cell:
+            return
+        self._last_cell = cell
+        
+        pos = self.get_grid_position(point)
         if pos != self.hover_pos:
+            # Only repaint the cells that gained or lost the highlight
+            if self.hover_pos:
+                self.update(self._cell_rect(self.hover_pos))
             self.hover_pos = pos
-            self.update()
+            if pos:
+                self.update(self._cell_rect(pos))
         
-        # Handle drag placement - prevent duplicates with processing set
+        # Handle drag placement - prevent duplicates with processing flags
         if self.dragging and pos and pos in self.valid_positions:
-            if pos not in self._drag_visited and pos not in self._processing_positions:
+            index = pos[0] * self.grid_size + pos[1]
+            if pos not in self._drag_visited and not self._processing_cells[index]:
                 self._drag_visited.add(pos)
-                self._processing_positions.add(pos)
+                self._processing_cells[index] = 1
                 self.place_block_requested.emit(pos)
     
     def mouseReleaseEvent(self, event):
@@ -246,7 +747,7 @@ class BlockmakerGrid(QWidget):
             self.dragging = False
             self.drag_start_pos = None
             self._drag_visited = set()
-            self._processing_positions = set()
+            self._processing_cells[:] = bytes(len(self._processing_cells))
     
     def get_grid_position(self, pos) -> Optional[Tuple[int, int]]:
         """Convert screen position to grid position"""
@@ -260,16 +761,79 @@ class BlockmakerGrid(QWidget):
     
     def add_block(self, pos: Tuple[int, int], block_num: int):
         """Add a block to the grid"""
+        first_block = not self.blocks
         self.blocks[pos] = block_num
+        self.occupied[pos[0] * self.grid_size + pos[1]] = 1
+        
+        # Grow the frontier incrementally instead of rescanning every block
+        valid_list = self._valid_list
+        valid_index = self._valid_index
+        if first_block:
+            # Drop the "anywhere" positions
+            self.valid_positions.clear()
+            valid_list.clear()
+            valid_index.clear()
+        index = valid_index.pop(pos, None)
+        if index is not None:
+            # Swap-remove keeps the list dense without shifting
+            self.valid_positions.discard(pos)
+            last = valid_list.pop()
+            if index < len(valid_list):
+                valid_list[index] = last
+                valid_index[last] = index
+        row, col = pos
+        grid_size = self.grid_size
+        for dr, dc in _DIRS:
+            new_row, new_col = row + dr, col + dc
+            if 0 <= new_row < grid_size and 0 <= new_col < grid_size and not self.occupied[new_row * grid_size + new_col]:
+                neighbour = (new_row, new_col)
+                if neighbour not in valid_index:
+                    self.valid_positions.add(neighbour)
+                    valid_index[neighbour] = len(valid_list)
+                    valid_list.append(neighbour)
+        self.invalidate_blocks()
+    
+    def add_blocks(self, items):
+        """Add several (pos, block_num) blocks with a single repaint"""
+        self.setUpdatesEnabled(False)
+        try:
+            for pos, block_num in items:
+                self.add_block(pos, block_num)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+    
+    def random_valid_position(self) -> Optional[Tuple[int, int]]:
+        """Pick a uniformly random valid position without copying the set"""
+        if not self._valid_list:
+            return None
+        return _choice(self._valid_list)
+    
+    def take_snapshot(self) -> tuple:
+        """Detach the current state, leaving an empty grid; undo with restore_snapshot()"""
+        snapshot = (self.blocks, bytes(self.occupied), self.valid_positions, self._valid_list, self._valid_index)
+        self.blocks = {}
+        self.blocks_version += 1  # No repaint - the cached layer keeps showing the detached blocks
+        self.occupied[:] = bytes(len(self.occupied))
+        self.valid_positions = set()
+        self._valid_list = []
+        self._valid_index = {}
         self.update_valid_positions()
-        self.update()
+        return snapshot
+    
+    def restore_snapshot(self, snapshot: tuple):
+        """Reattach state from take_snapshot() without rebuilding the bitmap or frontier"""
+        self.blocks, occupied, self.valid_positions, self._valid_list, self._valid_index = snapshot
+        self.occupied[:] = occupied
+        self.invalidate_blocks()
     
     def clear_grid(self, reset_spinbox=True):
         """Clear all blocks from the grid"""
         self.blocks.clear()
+        self.occupied[:] = bytes(len(self.occupied))
         self.valid_positions.clear()
         self.update_valid_positions()
-        self.update()
+        self.invalidate_blocks()
         if reset_spinbox and hasattr(self, 'count_spinbox'):
             self.count_spinbox.setValue(1)
     
@@ -279,20 +843,14 @@ class BlockmakerGrid(QWidget):
         
         if not self.blocks:
             # First block can go anywhere
-            for row in range(self.grid_size):
-                for col in range(self.grid_size):
-                    self.valid_positions.add((row, col))
+            grid_size = self.grid_size
+            self.valid_positions.update((row, col) for row in range(grid_size) for col in range(grid_size))
         else:
             # Subsequent blocks must be adjacent to existing blocks
-            for pos in self.blocks.keys():
-                row, col = pos
-                # Check all adjacent positions
-                for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                    new_row, new_col = row + dr, col + dc
-                    if (0 <= new_row < self.grid_size and 
-                        0 <= new_col < self.grid_size and
-                        (new_row, new_col) not in self.blocks):
-                        self.valid_positions.add((new_row, new_col))
+            self.valid_positions.update(_compute_frontier(self.occupied, self.grid_size))
+        self._valid_list[:] = self.valid_positions
+        self._valid_index.clear()
+        self._valid_index.update((pos, index) for index, pos in enumerate(self._valid_list))
     
     # Signal for block placement requests
     place_block_requested = pyqtSignal(tuple)
@@ -301,12 +859,21 @@ class BlockmakerGrid(QWidget):
 class DreamMechaIntegration(QWidget):
     """Dream Mecha game integration panel for content generation"""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, main_window=None):
         super().__init__(parent)
+        self._main_window = main_window  # BlockmakerWindow whose grid builds patterns
         self.generated_pieces = []
         self.generated_enemies = []
         self.manual_pieces = []  # Separate list for manual pieces
         self.current_date = date.today()
+        
+        # Status messages are buffered and flushed together to avoid a relayout per line
+        self._log_buf = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -322,9 +889,9 @@ class DreamMechaIntegration(QWidget):
             font-weight: bold;
             color: {GOLD};
             margin-bottom: 10px;
-            font-family: '{DREAM_MECHA_FONT}', {FALLBACK_FONTS};
             letter-spacing: 1px;
         """)
+        title.setFont(_dream_mecha_font())
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
@@ -332,12 +899,7 @@ class DreamMechaIntegration(QWidget):
         main_splitter = QSplitter(Qt.Orientation.Horizontal)
         main_splitter.setChildrenCollapsible(False)
         main_splitter.setHandleWidth(3)
-        main_splitter.setStyleSheet(f"""
-            QSplitter::handle {{
-                background: {BORDER_COLOR};
-                border-radius: 1px;
-            }}
-        """)
+        main_splitter.setStyleSheet(_SPLITTER_QSS)
         
         # Left side - Generation Controls
         left_widget = QWidget()
@@ -346,54 +908,21 @@ class DreamMechaIntegration(QWidget):
         
         # Generation Parameters Group
         params_group = QGroupBox("Generation Parameters")
-        params_group.setStyleSheet(f"""
-            QGroupBox {{
-                background: {UPGRADE_BG};
-                border: 2px solid {BORDER_COLOR};
-                border-radius: 5px;
-                padding: 10px;
-                font-weight: bold;
-                color: {TEXT_COLOR};
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: {GOLD};
-            }}
-        """)
+        params_group.setStyleSheet(_GROUPBOX_QSS)
         params_layout = QFormLayout(params_group)
         
         # Player Count
         self.player_count_spinbox = QSpinBox()
         self.player_count_spinbox.setRange(1, 100)
         self.player_count_spinbox.setValue(10)
-        self.player_count_spinbox.setStyleSheet(f"""
-            QSpinBox {{
-                background: {TAB_BG};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 3px;
-                padding: 5px;
-                color: {TEXT_COLOR};
-                min-width: 80px;
-            }}
-        """)
+        self.player_count_spinbox.setStyleSheet(_SPINBOX_QSS)
         params_layout.addRow("Active Player Count:", self.player_count_spinbox)
         
         # Voidstate
         self.voidstate_spinbox = QSpinBox()
         self.voidstate_spinbox.setRange(1, 50)
         self.voidstate_spinbox.setValue(1)
-        self.voidstate_spinbox.setStyleSheet(f"""
-            QSpinBox {{
-                background: {TAB_BG};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 3px;
-                padding: 5px;
-                color: {TEXT_COLOR};
-                min-width: 80px;
-            }}
-        """)
+        self.voidstate_spinbox.setStyleSheet(_SPINBOX_QSS)
         params_layout.addRow("Current Voidstate:", self.voidstate_spinbox)
         
         # Generation Date
@@ -415,104 +944,31 @@ class DreamMechaIntegration(QWidget):
         
         # Generation Controls Group
         controls_group = QGroupBox("Generation Controls")
-        controls_group.setStyleSheet(f"""
-            QGroupBox {{
-                background: {UPGRADE_BG};
-                border: 2px solid {BORDER_COLOR};
-                border-radius: 5px;
-                padding: 10px;
-                font-weight: bold;
-                color: {TEXT_COLOR};
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: {GOLD};
-            }}
-        """)
+        controls_group.setStyleSheet(_GROUPBOX_QSS)
         controls_layout = QVBoxLayout(controls_group)
         
         # Generation Buttons
         self.generate_btn = QPushButton("Generate Daily Content")
-        self.generate_btn.setStyleSheet(f"""
-            QPushButton {{ 
-                background: {GOLD}; 
-                color: #000000; 
-                border: none; 
-                border-radius: 5px; 
-                padding: 12px 20px; 
-                font-weight: bold; 
-                font-size: 14px;
-            }}
-            QPushButton:hover {{ background: #ffd700; }}
-            QPushButton:pressed {{ background: #e6c200; }}
-        """)
+        self.generate_btn.setStyleSheet(_GOLD_BUTTON_QSS)
         controls_layout.addWidget(self.generate_btn)
         
         self.export_btn = QPushButton("Export to JSON")
-        self.export_btn.setStyleSheet(f"""
-            QPushButton {{ 
-                background: {SECONDARY_ACCENT}; 
-                color: #fff; 
-                border: none; 
-                border-radius: 5px; 
-                padding: 10px 16px; 
-                font-weight: bold; 
-            }}
-            QPushButton:hover {{ background: #8ea6f8; }}
-            QPushButton:pressed {{ background: #5c6bc0; }}
-        """)
+        self.export_btn.setStyleSheet(_SECONDARY_BUTTON_QSS)
         controls_layout.addWidget(self.export_btn)
         
         self.preview_btn = QPushButton("Preview Shop")
-        self.preview_btn.setStyleSheet(f"""
-            QPushButton {{ 
-                background: {SECONDARY_ACCENT}; 
-                color: #fff; 
-                border: none; 
-                border-radius: 5px; 
-                padding: 10px 16px; 
-                font-weight: bold; 
-            }}
-            QPushButton:hover {{ background: #8ea6f8; }}
-            QPushButton:pressed {{ background: #5c6bc0; }}
-        """)
+        self.preview_btn.setStyleSheet(_SECONDARY_BUTTON_QSS)
         controls_layout.addWidget(self.preview_btn)
         
         # Manual Piece Generation
         manual_group = QGroupBox("Manual Piece Generation")
-        manual_group.setStyleSheet(f"""
-            QGroupBox {{
-                background: {UPGRADE_BG};
-                border: 2px solid {BORDER_COLOR};
-                border-radius: 5px;
-                padding: 10px;
-                font-weight: bold;
-                color: {TEXT_COLOR};
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: {GOLD};
-            }}
-        """)
+        manual_group.setStyleSheet(_GROUPBOX_QSS)
         manual_layout = QFormLayout(manual_group)
         
         self.manual_block_count = QSpinBox()
         self.manual_block_count.setRange(1, 80)
         self.manual_block_count.setValue(5)
-        self.manual_block_count.setStyleSheet(f"""
-            QSpinBox {{
-                background: {TAB_BG};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 3px;
-                padding: 5px;
-                color: {TEXT_COLOR};
-                min-width: 80px;
-            }}
-        """)
+        self.manual_block_count.setStyleSheet(_SPINBOX_QSS)
         manual_layout.addRow("Block Count:", self.manual_block_count)
         
         self.manual_stat_type = QComboBox()
@@ -555,33 +1011,19 @@ class DreamMechaIntegration(QWidget):
         
         # Status Group
         status_group = QGroupBox("Generation Status")
-        status_group.setStyleSheet(f"""
-            QGroupBox {{
-                background: {UPGRADE_BG};
-                border: 2px solid {BORDER_COLOR};
-                border-radius: 5px;
-                padding: 10px;
-                font-weight: bold;
-                color: {TEXT_COLOR};
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: {GOLD};
-            }}
-        """)
+        status_group.setStyleSheet(_GROUPBOX_QSS)
         status_layout = QVBoxLayout(status_group)
         
-        self.status_text = QTextEdit()
+        self.status_text = QPlainTextEdit()  # Append-only log, no rich text layout
+        self.status_text.setReadOnly(True)
+        self.status_text.setFont(_dream_mecha_font())
         self.status_text.setStyleSheet(f"""
-            QTextEdit {{
+            QPlainTextEdit {{
                 background: {TAB_BG};
                 border: 1px solid {BORDER_COLOR};
                 border-radius: 3px;
                 padding: 5px;
                 color: {TEXT_COLOR};
-                font-family: '{DREAM_MECHA_FONT}', {FALLBACK_FONTS};
                 font-size: 10px;
             }}
         """)
@@ -592,36 +1034,12 @@ class DreamMechaIntegration(QWidget):
         
         # Preview Group
         preview_group = QGroupBox("Generated Content Preview")
-        preview_group.setStyleSheet(f"""
-            QGroupBox {{
-                background: {UPGRADE_BG};
-                border: 2px solid {BORDER_COLOR};
-                border-radius: 5px;
-                padding: 10px;
-                font-weight: bold;
-                color: {TEXT_COLOR};
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: {GOLD};
-            }}
-        """)
+        preview_group.setStyleSheet(_GROUPBOX_QSS)
         preview_layout = QVBoxLayout(preview_group)
         
         self.preview_text = QTextEdit()
-        self.preview_text.setStyleSheet(f"""
-            QTextEdit {{
-                background: {TAB_BG};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 3px;
-                padding: 5px;
-                color: {TEXT_COLOR};
-                font-family: '{DREAM_MECHA_FONT}', {FALLBACK_FONTS};
-                font-size: 11px;
-            }}
-        """)
+        self.preview_text.setStyleSheet(_PREVIEW_TEXTEDIT_QSS)
+        self.preview_text.setFont(_dream_mecha_font())
         self.preview_text.setMinimumHeight(400)  # Make preview area larger
         preview_layout.addWidget(self.preview_text)
         
@@ -629,36 +1047,12 @@ class DreamMechaIntegration(QWidget):
         
         # Manual Piece Preview Group
         manual_preview_group = QGroupBox("Manual Piece Preview")
-        manual_preview_group.setStyleSheet(f"""
-            QGroupBox {{
-                background: {UPGRADE_BG};
-                border: 2px solid {BORDER_COLOR};
-                border-radius: 5px;
-                padding: 10px;
-                font-weight: bold;
-                color: {TEXT_COLOR};
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: {GOLD};
-            }}
-        """)
+        manual_preview_group.setStyleSheet(_GROUPBOX_QSS)
         manual_preview_layout = QVBoxLayout(manual_preview_group)
         
         self.manual_preview_text = QTextEdit()
-        self.manual_preview_text.setStyleSheet(f"""
-            QTextEdit {{
-                background: {TAB_BG};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 3px;
-                padding: 5px;
-                color: {TEXT_COLOR};
-                font-family: '{DREAM_MECHA_FONT}', {FALLBACK_FONTS};
-                font-size: 11px;
-            }}
-        """)
+        self.manual_preview_text.setStyleSheet(_PREVIEW_TEXTEDIT_QSS)
+        self.manual_preview_text.setFont(_dream_mecha_font())
         self.manual_preview_text.setMinimumHeight(200)
         manual_preview_layout.addWidget(self.manual_preview_text)
         
@@ -684,7 +1078,15 @@ class DreamMechaIntegration(QWidget):
     def log_status(self, message: str):
         """Add message to status log"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.status_text.append(f"[{timestamp}] {message}")
+        self._log_buf.append(f"[{timestamp}] {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _flush_log(self):
+        """Append all buffered status messages in one go"""
+        if self._log_buf:
+            self.status_text.appendPlainText("\n".join(self._log_buf))
+            self._log_buf.clear()
         
     def generate_daily_content(self):
         """Generate daily shop pieces and enemies"""
@@ -696,8 +1098,13 @@ class DreamMechaIntegration(QWidget):
             self.log_status(f"Generating daily content for {gen_date}...")
             self.log_status(f"Player count: {player_count}, Voidstate: {voidstate}")
             
-            # Generate shop pieces
-            self.generated_pieces = self.generate_daily_pieces_beta(player_count, voidstate, gen_date)
+            # Generate shop pieces - patterns are built on the live blockmaker grid,
+            # so this stays on the GUI thread; show a busy cursor meanwhile
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            try:
+                self.generated_pieces = self.generate_daily_pieces_beta(player_count, voidstate, gen_date)
+            finally:
+                QApplication.restoreOverrideCursor()
             self.log_status(f"Generated {len(self.generated_pieces)} shop pieces")
             
             # Generate enemies
@@ -717,49 +1124,35 @@ class DreamMechaIntegration(QWidget):
         
         # Calculate total pieces needed
         base_pieces = 8
-        scaling_pieces = math.floor(player_count * 1.5)
+        scaling_pieces = player_count * 3 // 2
         total_pieces = base_pieces + scaling_pieces
         
-        # Size distribution (all using random algorithm)
-        small_pieces = math.floor(total_pieces * 0.5)    # 1-5 blocks
-        medium_pieces = math.floor(total_pieces * 0.4)   # 6-15 blocks  
-        large_pieces = math.floor(total_pieces * 0.1)    # 16-25 blocks
-        
-        # Generate pieces by size category
+        # Size distribution (all using random algorithm) - integer split, so the
+        # buckets always add up to total_pieces (rounding remainder goes to large)
+        small_pieces = total_pieces // 2                              # 1-5 blocks
+        medium_pieces = total_pieces * 4 // 10                        # 6-15 blocks
+        large_pieces = total_pieces - small_pieces - medium_pieces    # 16-25 blocks
+        
+        # Generate pieces by size category: (category, min blocks, max blocks, count)
+        size_buckets = (
+            ("small", 1, 5, small_pieces),
+            ("medium", 6, 15, medium_pieces),
+            ("large", 16, 25, large_pieces),
+        )
+        id_template = "piece_" + gen_date.strftime('%Y%m%d') + "_%03d"  # Same date for every piece
         piece_id_counter = 1
         
-        # Small pieces (1-5 blocks)
-        for i in range(small_pieces):
-            block_count = random.randint(1, 5)
-            piece = self.generate_single_piece_manual(block_count, "random")
-            piece["id"] = f"piece_{gen_date.strftime('%Y%m%d')}_{piece_id_counter:03d}"
-            piece["size_category"] = "small"
-            piece["generation_method"] = "random"
-            piece["beta_mode"] = True
-            pieces.append(piece)
-            piece_id_counter += 1
-            
-        # Medium pieces (6-15 blocks)
-        for i in range(medium_pieces):
-            block_count = random.randint(6, 15)
-            piece = self.generate_single_piece_manual(block_count, "random")
-            piece["id"] = f"piece_{gen_date.strftime('%Y%m%d')}_{piece_id_counter:03d}"
-            piece["size_category"] = "medium"
-            piece["generation_method"] = "random"
-            piece["beta_mode"] = True
-            pieces.append(piece)
-            piece_id_counter += 1
-            
-        # Large pieces (16-25 blocks)
-        for i in range(large_pieces):
-            block_count = random.randint(16, 25)
-            piece = self.generate_single_piece_manual(block_count, "random")
-            piece["id"] = f"piece_{gen_date.strftime('%Y%m%d')}_{piece_id_counter:03d}"
-            piece["size_category"] = "large"
-            piece["generation_method"] = "random"
-            piece["beta_mode"] = True
-            pieces.append(piece)
-            piece_id_counter += 1
+        for size_category, min_blocks, max_blocks, count in size_buckets:
+            # Draw every block count for the bucket in one call
+            block_counts = random.choices(range(min_blocks, max_blocks + 1), k=count)
+            for block_count in block_counts:
+                piece = self.generate_single_piece_manual(block_count, "random")
+                piece["id"] = id_template % piece_id_counter
+                piece["size_category"] = size_category
+                piece["generation_method"] = "random"
+                piece["beta_mode"] = True
+                pieces.append(piece)
+                piece_id_counter += 1
             
         return pieces
         
@@ -777,9 +1170,7 @@ class DreamMechaIntegration(QWidget):
         
         # Determine stat type
         if stat_type == "random":
-            stat_types = ["hp", "attack", "defense", "speed"]
-            weights = [0.4, 0.25, 0.2, 0.15]  # 40% HP, 25% Attack, 20% Defense, 15% Speed
-            stat_type = random.choices(stat_types, weights=weights)[0]
+            stat_type = _STAT_TYPES[bisect.bisect(_STAT_CUM_WEIGHTS, _rand())]
             
         # Create piece data
         piece_data = {
@@ -797,27 +1188,25 @@ class DreamMechaIntegration(QWidget):
         
     def generate_blockmaker_pattern(self, block_count: int, algorithm: str) -> str:
         """Generate pattern using REAL blockmaker algorithms"""
-        # Get the main blockmaker window instance
-        main_window = None
-        for widget in QApplication.topLevelWidgets():
-            if isinstance(widget, BlockmakerWindow):
-                main_window = widget
-                break
+        # Get the main blockmaker window instance (looked up once if not passed in)
+        if self._main_window is None:
+            self._main_window = next(iter(BlockmakerWindow._instances), None)
+        main_window = self._main_window
         
         if not main_window or not main_window.grid:
             # Fallback if main window not available
             return self.generate_fallback_pattern(block_count)
         
-        # Store original state
-        original_blocks = main_window.grid.blocks.copy()
+        # Store original state - detach the live grid state rather than copying it;
+        # generation then works on a fresh grid and restore_snapshot() reattaches it
+        original_grid = main_window.grid.take_snapshot()
         original_count = main_window.block_count
         original_spinbox_value = main_window.count_spinbox.value() if main_window.count_spinbox else 1
         
         try:
-            # Set up for generation
-            main_window.grid.clear_grid(reset_spinbox=False)
+            # Set up for generation (take_snapshot() already left an empty grid)
             if main_window.count_spinbox:
-                main_window.count_spinbox.setValue(block_count)
+                main_window._set_count_spinbox(block_count)
             
             # Generate pattern using random algorithm only
             main_window.generate_random_pattern()
@@ -833,136 +1222,72 @@ class DreamMechaIntegration(QWidget):
         
         finally:
             # Restore original state
-            main_window.grid.blocks = original_blocks
+            main_window.grid.restore_snapshot(original_grid)
             main_window.block_count = original_count
             if main_window.count_spinbox:
-                main_window.count_spinbox.setValue(original_spinbox_value)
-            main_window.grid.update_valid_positions()
-            main_window.grid.update()
+                main_window._set_count_spinbox(original_spinbox_value)
         
         return result_pattern
     
     def generate_fallback_pattern(self, block_count: int) -> str:
         """Simple fallback pattern if real blockmaker unavailable"""
-        # At least generate a proper adjacent pattern
-        if block_count <= 0:
-            return "+ "
-        elif block_count == 1:
-            return "+"
-        elif block_count == 2:
-            return "+ 2"
-        elif block_count == 3:
-            return "+ 2\n3 ."
-        elif block_count == 4:
-            return "+ 2\n3 4"
-        else:
-            # For larger pieces, create a simple rectangular pattern
-            pattern = "+ 2\n3 4"
-            remaining = block_count - 4
-            if remaining > 0:
-                pattern += f"\n{5} {6 if remaining > 1 else '.'}"
-            if remaining > 2:
-                pattern += f"\n{7} {8 if remaining > 3 else '.'}"
-        return pattern
+        # At least generate a proper adjacent pattern - capped at a 2x4 block of 8 numbers
+        return _FALLBACK_PATTERNS[max(0, min(block_count, len(_FALLBACK_PATTERNS) - 1))]
         
     def pattern_to_array(self, pattern: str) -> List[List[int]]:
         """Convert pattern string to 2D array"""
         lines = pattern.strip().split('\n')
-        result = []
-        
-        for line in lines:
-            row = []
-            for char in line:
-                if char == '+':
-                    row.append(1)
-                elif char == '.':
-                    row.append(0)
-                elif char.isdigit():
-                    row.append(int(char))
-                else:
-                    row.append(0)
-            result.append(row)
+        
+        # One C-level byte translation per line: '+' -> 1, '0'-'9' -> digit, anything else -> 0
+        result = [list(line.encode('ascii', 'replace').translate(_PATTERN_CELL_TABLE)) for line in lines]
         
         # If we have a single row that's very long, it might be a flattened pattern
         # Try to reshape it into a more reasonable 2D shape
         if len(result) == 1 and len(result[0]) > 8:
             flat_row = result[0]
-            # Find non-zero positions to determine actual shape
-            non_zero_positions = [(i, val) for i, val in enumerate(flat_row) if val > 0]
-            if non_zero_positions:
-                # Try to determine grid dimensions from the positions
-                max_pos = max(pos for pos, val in non_zero_positions)
+            # The last non-zero position determines the actual shape
+            max_pos = next((i for i in range(len(flat_row) - 1, -1, -1) if flat_row[i] > 0), None)
+            if max_pos is not None:
                 # Assume a reasonable grid size (12x12 like the game)
                 grid_width = 12 if max_pos >= 12 else max(8, max_pos + 1)
                 
-                # Reshape into 2D grid
-                reshaped = []
-                for row_idx in range((len(flat_row) + grid_width - 1) // grid_width):
-                    row = []
-                    for col_idx in range(grid_width):
-                        flat_idx = row_idx * grid_width + col_idx
-                        if flat_idx < len(flat_row):
-                            row.append(flat_row[flat_idx])
-                        else:
-                            row.append(0)
-                    reshaped.append(row)
-                result = reshaped
+                # Reshape into 2D grid by slicing, zero-padding the last row
+                padded = flat_row + [0] * (-len(flat_row) % grid_width)
+                result = [padded[i:i + grid_width] for i in range(0, len(padded), grid_width)]
         
         return result
         
     def calculate_proper_piece_stats(self, block_count: int, stat_type: str, algorithm: str) -> Dict[str, int]:
         """Calculate stats using proper game rules exponential scaling"""
         # Game rules: exponential scaling ~100 HP per block base, exponentially increasing
-        base_hp = 100
-        scaling_factor = 1.6  # Game rules scaling factor
-        total_stat_power = int(base_hp * (block_count ** scaling_factor))
+        if 0 <= block_count < len(_STAT_POWER_TABLE):
+            total_stat_power = _STAT_POWER_TABLE[block_count]
+        else:
+            total_stat_power = int(_PIECE_BASE_HP * (block_count ** _PIECE_STAT_SCALING))
         
         # Each piece gives ONLY ONE stat (use the specified stat_type)
-        stat_types = ["hp", "attack", "defense", "speed"]
-        
         # Use the specified stat_type, or random if "random"
         if stat_type == "random":
-            chosen_stat = random.choice(stat_types)
+            chosen_stat = _choice(_STAT_TYPES)
         else:
-            # Map stat_type to the correct stat name
-            stat_mapping = {
-                "hp": "hp",
-                "attack": "attack", 
-                "defense": "defense",
-                "speed": "speed"
-            }
-            chosen_stat = stat_mapping.get(stat_type, "hp")  # Default to hp if invalid
-        
-        # All power goes to the chosen stat
-        base_stats = {
-            "hp": 0,
-            "attack": 0,
-            "defense": 0,
-            "speed": 0
-        }
-        base_stats[chosen_stat] = total_stat_power
+            chosen_stat = stat_type if stat_type in _STAT_TYPES else "hp"  # Default to hp if invalid
         
-        # Add variance (±15%)
+        # Add variance (±15%) - one random() draw scaled into [1 - variance, 1 + variance)
         variance = 0.15
-        base_value = base_stats[chosen_stat]
-        min_value = int(base_value * (1 - variance))
-        max_value = int(base_value * (1 + variance))
-        base_stats[chosen_stat] = random.randint(min_value, max_value)
+        value = int(total_stat_power * (1 + (_rand() * 2 - 1) * variance))
         
-        # Convert to expected format
-        return {
-            "hp": base_stats["hp"],
-            "att": base_stats["attack"],
-            "def": base_stats["defense"],
-            "spd": base_stats["speed"]
-        }
+        # All power goes to the chosen stat, in the expected (abbreviated) format
+        stats = {"hp": 0, "att": 0, "def": 0, "spd": 0}
+        stats[_STAT_KEYS[chosen_stat]] = value
+        return stats
         
     def calculate_proper_piece_price(self, block_count: int, stats: Dict[str, int]) -> int:
         """Calculate piece price using game rules exponential scaling"""
         # Game rules: base_cost * (block_count ^ scaling_factor)
-        base_cost = 100
-        scaling_factor = 1.8
-        block_price = int(base_cost * (block_count ** scaling_factor))
+        if 0 <= block_count < len(_BLOCK_PRICE_TABLE):
+            block_price = _BLOCK_PRICE_TABLE[block_count]
+        else:
+            block_price = int(_PIECE_BASE_COST * (block_count ** _PIECE_PRICE_SCALING))
         
         # Add stat bonus (30% of total stats value)
         total_stats = stats["hp"] + stats["att"] + stats["def"] + stats["spd"]
@@ -970,23 +1295,13 @@ class DreamMechaIntegration(QWidget):
         
         final_price = block_price + stat_bonus
         
-        # Add price variance (±10%)
+        # Add price variance (±10%) - one random() draw scaled into [1 - variance, 1 + variance)
         variance = 0.1
-        min_price = int(final_price * (1 - variance))
-        max_price = int(final_price * (1 + variance))
-        
-        return random.randint(min_price, max_price)
+        return int(final_price * (1 + (_rand() * 2 - 1) * variance))
         
     def determine_rarity(self, block_count: int) -> str:
         """Determine piece rarity based on block count"""
-        if block_count <= 5:
-            return "common"
-        elif block_count <= 15:
-            return "uncommon"
-        elif block_count <= 25:
-            return "rare"
-        else:
-            return "legendary"
+        return _RARITY_LEVELS[bisect.bisect_left(_RARITY_MAX_BLOCKS, block_count)]
             
     def estimate_player_power(self, player_count: int) -> Dict[str, int]:
         """Estimate average player power for enemy scaling"""
@@ -1005,74 +1320,53 @@ class DreamMechaIntegration(QWidget):
         # Generate 1-3 enemies based on voidstate
         enemy_count = min(3, 1 + voidstate // 5)
         
-        for i in range(enemy_count):
-            # Base enemy scales with estimated community power
-            base_hp = estimated_power["avg_hp"] * 0.8
-            base_att = estimated_power["avg_att"] * 0.6
-            
-            # Voidstate multiplier  
-            void_multiplier = 1 + (voidstate * 0.2)
-            
-            enemy_hp = int(base_hp * void_multiplier)
-            enemy_att = int(base_att * void_multiplier)
-            enemy_def = int(enemy_hp * 0.1)  # 10% of HP
-            enemy_spd = int(enemy_att * 0.3) # 30% of attack
-            
-            description = self.generate_enemy_description(enemy_hp, enemy_att, enemy_def, enemy_spd)
-            
+        # Stats depend only on voidstate and community power, so they are the same
+        # for every enemy today - compute them once outside the loop
+        # Base enemy scales with estimated community power
+        base_hp = estimated_power["avg_hp"] * 0.8
+        base_att = estimated_power["avg_att"] * 0.6
+        
+        # Voidstate multiplier  
+        void_multiplier = 1 + (voidstate * 0.2)
+        
+        enemy_hp = int(base_hp * void_multiplier)
+        enemy_att = int(base_att * void_multiplier)
+        enemy_def = int(enemy_hp * 0.1)  # 10% of HP
+        enemy_spd = int(enemy_att * 0.3) # 30% of attack
+        threat_level = self.determine_threat_level(enemy_hp, enemy_att)
+        id_prefix = f"enemy_{date.today().strftime('%Y%m%d')}_"
+        
+        descriptions = self.generate_enemy_descriptions(enemy_hp, enemy_att, enemy_count)
+        
+        for i, description in enumerate(descriptions):
             enemy = {
-                "id": f"enemy_{date.today().strftime('%Y%m%d')}_{i+1:03d}",
+                "id": f"{id_prefix}{i+1:03d}",
                 "hp": enemy_hp,
                 "att": enemy_att, 
                 "def": enemy_def,
                 "spd": enemy_spd,
                 "description": description,
-                "threat_level": self.determine_threat_level(enemy_hp, enemy_att)
+                "threat_level": threat_level
             }
             
             enemies.append(enemy)
             
         return enemies
         
-    def generate_enemy_description(self, hp: int, att: int, def_val: int, spd: int) -> str:
-        """Generate procedural enemy description based on stats"""
-        # Simplified descriptor system for now
-        descriptors = {
-            "size": {
-                "tier1": ["small", "tiny", "diminutive"],
-                "tier2": ["hulking", "large", "imposing"],
-                "tier3": ["colossal", "gigantic", "enormous"],
-                "tier4": ["world-ending", "cosmic", "reality-bending"]
-            },
-            "threat": {
-                "tier1": ["with gnashing teeth", "sporting sharp claws"],
-                "tier2": ["bristling with razor spikes", "wreathed in shadow flames"],
-                "tier3": ["channeling destructive force", "emanating reality-warping power"],
-                "tier4": ["radiating universe-ending power", "bending space-time"]
-            }
-        }
-        
+    def generate_enemy_descriptions(self, hp: int, att: int, count: int) -> List[str]:
+        """Generate count descriptions for enemies sharing the same stats, drawing all picks at once"""
         # Determine tiers based on stats
         hp_tier = min(4, 1 + hp // 100000)  # Scale tiers based on HP
         att_tier = min(4, 1 + att // 10000)  # Scale tiers based on attack
         
-        # Select descriptors
-        size_desc = random.choice(descriptors["size"][f"tier{hp_tier}"])
-        threat_desc = random.choice(descriptors["threat"][f"tier{att_tier}"])
-        
-        return f"A {size_desc} void beast {threat_desc}"
+        size_descs = random.choices(_SIZE_DESCRIPTOR_TIERS[hp_tier - 1], k=count)
+        threat_descs = random.choices(_THREAT_DESCRIPTOR_TIERS[att_tier - 1], k=count)
         
+        return [f"A {size_desc} void beast {threat_desc}" for size_desc, threat_desc in zip(size_descs, threat_descs)]
+    
     def determine_threat_level(self, hp: int, att: int) -> str:
         """Determine enemy threat level"""
-        total_power = hp + att
-        if total_power < 50000:
-            return "low"
-        elif total_power < 150000:
-            return "moderate"
-        elif total_power < 500000:
-            return "high"
-        else:
-            return "extreme"
+        return _THREAT_LEVELS[bisect.bisect_right(_THREAT_POWER_THRESHOLDS, hp + att)]
             
     def generate_manual_piece(self):
         """Generate a single piece for testing"""
@@ -1133,8 +1427,12 @@ class DreamMechaIntegration(QWidget):
             filename = f"{gen_date.strftime('%Y-%m-%d')}.json"
             filepath = os.path.join(export_dir, filename)
             
-            with open(filepath, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w') as f:
+                    json.dump(export_data, f, indent=2)
                 
             # Generate icons for the pieces
             if ICON_GENERATION_AVAILABLE:
@@ -1159,35 +1457,33 @@ class DreamMechaIntegration(QWidget):
             self.log_status("No pieces to preview. Generate content first.")
             return
             
-        preview_text = "=== DREAM MECHA DAILY SHOP ===\n\n"
+        parts = ["=== DREAM MECHA DAILY SHOP ===\n\n"]
         
         for i, piece in enumerate(self.generated_pieces, 1):
-            preview_text += f"Piece {i}: {piece['id']}\n"
-            preview_text += f"  Size: {piece['size_category']} ({piece['blocks']} blocks)\n"
+            parts.append(f"Piece {i}: {piece['id']}\n")
+            parts.append(f"  Size: {piece['size_category']} ({piece['blocks']} blocks)\n")
             # Only show the single stat that has value
-            active_stat = None
-            for stat_name, stat_value in piece['stats'].items():
-                if stat_value > 0:
-                    active_stat = (stat_name.upper(), stat_value)
-                    break
+            active_stat = _find_active_stat(piece['stats'])
             
             if active_stat:
-                preview_text += f"  Stats: {active_stat[0]}:{active_stat[1]}\n"
+                parts.append(f"  Stats: {active_stat[0]}:{active_stat[1]}\n")
             else:
-                preview_text += f"  Stats: ERROR - No active stat found\n"
-            preview_text += f"  Type: {piece['stat_type']}\n"
-            preview_text += f"  Price: {piece['price']} Zoltans\n"
-            preview_text += f"  Rarity: {piece['rarity']}\n"
-            preview_text += f"  Pattern:\n{piece['pattern']}\n\n"
+                parts.append(f"  Stats: ERROR - No active stat found\n")
+            parts.append(f"  Type: {piece['stat_type']}\n")
+            parts.append(f"  Price: {piece['price']} Zoltans\n")
+            parts.append(f"  Rarity: {piece['rarity']}\n")
+            parts.append(f"  Pattern:\n{piece['pattern']}\n\n")
             
         if self.generated_enemies:
-            preview_text += "=== DAILY ENEMIES ===\n\n"
+            parts.append("=== DAILY ENEMIES ===\n\n")
             for i, enemy in enumerate(self.generated_enemies, 1):
-                preview_text += f"Enemy {i}: {enemy['id']}\n"
-                preview_text += f"  Stats: HP:{enemy['hp']} ATK:{enemy['att']} DEF:{enemy['def']} SPD:{enemy['spd']}\n"
-                preview_text += f"  Threat: {enemy['threat_level']}\n"
-                preview_text += f"  Description: {enemy['description']}\n\n"
+                parts.append(f"Enemy {i}: {enemy['id']}\n")
+                parts.append(f"  Stats: HP:{enemy['hp']} ATK:{enemy['att']} DEF:{enemy['def']} SPD:{enemy['spd']}\n")
+                parts.append(f"  Threat: {enemy['threat_level']}\n")
+                parts.append(f"  Description: {enemy['description']}\n\n")
                 
+        # Join once - repeated str += copies the whole preview on every line
+        preview_text = "".join(parts)
         self.preview_text.setPlainText(preview_text)
         self.log_status("Shop preview updated")
         
@@ -1202,28 +1498,25 @@ class DreamMechaIntegration(QWidget):
             self.manual_preview_text.setPlainText("No manual pieces generated yet.")
             return
             
-        preview_text = "=== MANUAL PIECE TESTING ===\n\n"
+        parts = ["=== MANUAL PIECE TESTING ===\n\n"]
         
         for i, piece in enumerate(self.manual_pieces[-5:], 1):  # Show last 5 manual pieces
-            preview_text += f"Piece {i}: {piece['id']}\n"
-            preview_text += f"  Size: {piece.get('size_category', 'manual')} ({piece['blocks']} blocks)\n"
+            parts.append(f"Piece {i}: {piece['id']}\n")
+            parts.append(f"  Size: {piece.get('size_category', 'manual')} ({piece['blocks']} blocks)\n")
             
             # Only show the single active stat
-            active_stat = None
-            for stat_name, stat_value in piece['stats'].items():
-                if stat_value > 0:
-                    active_stat = (stat_name.upper(), stat_value)
-                    break
+            active_stat = _find_active_stat(piece['stats'])
             
             if active_stat:
-                preview_text += f"  Stats: {active_stat[0]}:{active_stat[1]}\n"
+                parts.append(f"  Stats: {active_stat[0]}:{active_stat[1]}\n")
             else:
-                preview_text += f"  Stats: ERROR - No active stat found\n"
+                parts.append(f"  Stats: ERROR - No active stat found\n")
                 
-            preview_text += f"  Type: {piece['stat_type']}\n"
-            preview_text += f"  Price: {piece['price']} Zoltans\n"
-            preview_text += f"  Pattern:\n{piece['pattern']}\n\n"
+            parts.append(f"  Type: {piece['stat_type']}\n")
+            parts.append(f"  Price: {piece['price']} Zoltans\n")
+            parts.append(f"  Pattern:\n{piece['pattern']}\n\n")
             
+        preview_text = "".join(parts)
         self.manual_preview_text.setPlainText(preview_text)
     
     def generate_headless_daily_content(self, player_count: int, voidstate: int, gen_date: date = None) -> Dict[str, Any]:
@@ -1324,14 +1617,31 @@ class DreamMechaIntegration(QWidget):
 class BlockmakerWindow(QMainWindow):
     """Main window for the blockmaker tool"""
     
+    _instances = weakref.WeakSet()  # Live windows, so helpers can find one without scanning top-levels
+    
     def __init__(self):
         super().__init__()
+        BlockmakerWindow._instances.add(self)
         self.block_count = 1  # Start at 1, not 0
         self.gate_block_count = 1  # Block counter for gate grid
         self.auto_place_mode = False
+        self._ui_refresh_scheduled = False  # Coalesces debug/clipboard refreshes
+        self._last_pattern_text = ""  # Last text pushed to the clipboard pane
+        self._clipboard_dirty = False  # Pattern changed while the clipboard pane was off screen
+        self._last_portal_code = ""  # Code from the last generate_gate_portal, for the copy button
+        self._pattern_cache = (None, "")  # (grid.blocks_version, text) of the last ASCII pattern
+        self._clipboard = QApplication.clipboard()  # Application-wide, fetched once for the copy buttons
+        self._debug_buf = []  # Debug lines waiting for the next flush
+        self._logged_positions = set()  # Block positions already written to the debug log
+        self._debug_timer = QTimer(self)
+        self._debug_timer.setSingleShot(True)
+        self._debug_timer.setInterval(0)
+        self._debug_timer.timeout.connect(self._flush_debug_log)
         
         # Initialize UI components as None first
         self.grid = None
+        self.unique_grid = None  # Built with its deferred tab
+        self.gate_grid = None  # Built with its deferred tab
         self.count_spinbox = None
         self.create_btn = None
         self.random_btn = None
@@ -1364,12 +1674,7 @@ class BlockmakerWindow(QMainWindow):
             self.move(x, y)
         
         # Apply styling
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background: {TAB_BG};
-                color: {TEXT_COLOR};
-            }}
-        """)
+        self.setStyleSheet(_WINDOW_QSS)
     
     def setup_ui(self):
         """Create the user interface with tab system"""
@@ -1388,9 +1693,9 @@ class BlockmakerWindow(QMainWindow):
             font-weight: bold;
             color: {GOLD};
             margin-bottom: 10px;
-            font-family: '{DREAM_MECHA_FONT}', {FALLBACK_FONTS};
             letter-spacing: 2px;
         """)
+        title.setFont(_dream_mecha_font())
         title.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(title)
 
@@ -1432,14 +1737,17 @@ class BlockmakerWindow(QMainWindow):
         # Create Dream Mecha tab
         self.create_dream_mecha_tab()
         
+        # Unique Piece and GATE tabs are built the first time they are opened
+        self._deferred_tabs = {}  # placeholder widget -> builder returning the real tab
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        
         # Create Unique Piece Generation tab
-        self.create_unique_piece_tab()
+        self._add_deferred_tab("Unique Pieces", self.create_unique_piece_tab)
         
         # Create GATE tab if available
         if GATE_CREATOR_AVAILABLE:
-            print("Creating GATE tab...")
-            self.create_gate_tab()
-            print("GATE tab created")
+            self._add_deferred_tab("GATE", self.create_gate_tab)
+            print("GATE tab registered (deferred)")
         else:
             print("GATE modules not available, skipping tab")
         
@@ -1459,12 +1767,7 @@ class BlockmakerWindow(QMainWindow):
         main_splitter = QSplitter(Qt.Orientation.Horizontal)
         main_splitter.setChildrenCollapsible(False)
         main_splitter.setHandleWidth(3)
-        main_splitter.setStyleSheet(f"""
-            QSplitter::handle {{
-                background: {BORDER_COLOR};
-                border-radius: 1px;
-            }}
-        """)
+        main_splitter.setProperty("role", "panel")
         
         # Left side - Controls and Grid
         left_widget = QWidget()
@@ -1474,14 +1777,7 @@ class BlockmakerWindow(QMainWindow):
         
         # Controls section
         controls_frame = QFrame()
-        controls_frame.setStyleSheet(f"""
-            QFrame {{
-                background: {UPGRADE_BG};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 5px;
-                padding: 10px;
-            }}
-        """)
+        controls_frame.setStyleSheet(_PANEL_FRAME_QSS)
         controls_layout = QVBoxLayout(controls_frame)
         
         # Block count controls
@@ -1526,21 +1822,10 @@ class BlockmakerWindow(QMainWindow):
         self.clear_btn = QPushButton("Clear Grid")
 
         # --- Set styles for each button ---
-        self.create_btn.setStyleSheet(f"""
-            QPushButton {{ background: {GOLD}; color: #000000; border: none; border-radius: 5px; padding: 8px 16px; font-weight: bold; font-family: 'Segoe UI', Arial, sans-serif; }}
-            QPushButton:hover {{ background: #ffd700; }}
-            QPushButton:pressed {{ background: #e6c200; }}
-        """)
-        for btn in [self.random_btn, self.stars_btn, self.glyph_btn, self.mirror_h_btn, self.mirror_v_btn]:
-            btn.setStyleSheet(f"""
-                QPushButton {{ background: {SECONDARY_ACCENT}; color: #fff; border: none; border-radius: 5px; padding: 8px 16px; font-weight: bold; font-family: 'Segoe UI', Arial, sans-serif; }}
-                QPushButton:hover {{ background: #8ea6f8; }}
-                QPushButton:pressed {{ background: #5c6bc0; }}
-            """)
-        self.clear_btn.setStyleSheet(f"""
-            QPushButton {{ background: {BORDER_COLOR}; color: {TEXT_COLOR}; border: none; border-radius: 5px; padding: 8px 16px; font-weight: bold; font-family: 'Segoe UI', Arial, sans-serif; }}
-            QPushButton:hover {{ background: #4a5568; }}
-        """)
+        self.create_btn.setProperty("role", "create")
+        for btn in (self.random_btn, self.stars_btn, self.glyph_btn, self.mirror_h_btn, self.mirror_v_btn):
+            btn.setProperty("role", "tool")
+        self.clear_btn.setProperty("role", "clear")
 
         # --- Layouts ---
         button_row1 = QHBoxLayout()
@@ -1562,14 +1847,7 @@ class BlockmakerWindow(QMainWindow):
         
         # Grid section
         grid_frame = QFrame()
-        grid_frame.setStyleSheet(f"""
-            QFrame {{
-                background: {UPGRADE_BG};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 5px;
-                padding: 10px;
-            }}
-        """)
+        grid_frame.setStyleSheet(_PANEL_FRAME_QSS)
         grid_layout = QVBoxLayout(grid_frame)
         grid_layout.setContentsMargins(10, 10, 10, 10)
         grid_layout.setSpacing(5)
@@ -1592,23 +1870,11 @@ class BlockmakerWindow(QMainWindow):
         right_splitter = QSplitter(Qt.Orientation.Vertical)
         right_splitter.setChildrenCollapsible(False)
         right_splitter.setHandleWidth(3)
-        right_splitter.setStyleSheet(f"""
-            QSplitter::handle {{
-                background: {BORDER_COLOR};
-                border-radius: 1px;
-            }}
-        """)
+        right_splitter.setProperty("role", "panel")
         
         # Debug log (top)
         debug_frame = QFrame()
-        debug_frame.setStyleSheet(f"""
-            QFrame {{
-                background: {UPGRADE_BG};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 3px;
-                padding: 5px;
-            }}
-        """)
+        debug_frame.setStyleSheet(_LOG_FRAME_QSS)
         debug_frame.setMinimumHeight(200)
         debug_layout = QVBoxLayout(debug_frame)
         debug_layout.setContentsMargins(5, 5, 5, 5)
@@ -1626,11 +1892,14 @@ class BlockmakerWindow(QMainWindow):
                 border-radius: 3px;
                 padding: 3px;
                 color: {TEXT_COLOR};
-                font-family: '{DREAM_MECHA_FONT}', {FALLBACK_FONTS};
                 font-size: 9px;
             }}
         """)
         self.debug_text.setReadOnly(True)
+        self.debug_text.setFont(_dream_mecha_font())
+        self.debug_text.setUndoRedoEnabled(False)
+        self.debug_text.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.debug_text.setMaximumBlockCount(500)  # Keep only the most recent lines; appends stay cheap
         debug_layout.addWidget(self.debug_text)
         
         # Add Show/Hide Debug toggle
@@ -1658,14 +1927,7 @@ class BlockmakerWindow(QMainWindow):
         
         # Clipboard container (bottom)
         self.clipboard_frame = QFrame()
-        self.clipboard_frame.setStyleSheet(f"""
-            QFrame {{
-                background: {UPGRADE_BG};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 3px;
-                padding: 5px;
-            }}
-        """)
+        self.clipboard_frame.setStyleSheet(_LOG_FRAME_QSS)
         self.clipboard_frame.setMinimumHeight(150)
         clipboard_layout = QVBoxLayout(self.clipboard_frame)
         clipboard_layout.setContentsMargins(5, 5, 5, 5)
@@ -1683,11 +1945,14 @@ class BlockmakerWindow(QMainWindow):
                 border-radius: 3px;
                 padding: 3px;
                 color: {TEXT_COLOR};
-                font-family: '{DREAM_MECHA_FONT}', {FALLBACK_FONTS};
                 font-size: 8px;
             }}
         """)
         self.clipboard_text.setReadOnly(True)
+        self.clipboard_text.setFont(_dream_mecha_font())
+        self.clipboard_text.setUndoRedoEnabled(False)
+        self.clipboard_text.setLineWrapMode(QPlainTextEdit.NoWrap)  # Keep pattern rows aligned
+        self.clipboard_text.installEventFilter(self)  # Catch up on the pattern when it is shown again
         clipboard_layout.addWidget(self.clipboard_text)
         
         # Copy button
@@ -1735,23 +2000,12 @@ class BlockmakerWindow(QMainWindow):
         self.status_label.setAlignment(Qt.AlignCenter)
         blockmaker_layout.addWidget(self.status_label)
         
-        # Button feedback (highlight on press)
-        button_feedback_style = """
-            QPushButton:pressed {
-                background: #fffbe6;
-                color: #222;
-                border: 2px solid #f7c873;
-            }
-        """
-        for btn in [self.create_btn, self.random_btn, self.stars_btn, self.glyph_btn, self.clear_btn, self.mirror_h_btn, self.mirror_v_btn]:
-            btn.setStyleSheet(btn.styleSheet() + button_feedback_style)
-            
         # Add the blockmaker widget to the tab
         self.tab_widget.addTab(blockmaker_widget, "Blockmaker")
         
     def create_dream_mecha_tab(self):
         """Create the Dream Mecha integration tab"""
-        self.dream_mecha_integration = DreamMechaIntegration()
+        self.dream_mecha_integration = DreamMechaIntegration(main_window=self)
         self.tab_widget.addTab(self.dream_mecha_integration, "Dream Mecha")
     
     def create_unique_piece_tab(self):
@@ -1768,9 +2022,9 @@ class BlockmakerWindow(QMainWindow):
             font-weight: bold;
             color: {GOLD};
             margin-bottom: 10px;
-            font-family: '{DREAM_MECHA_FONT}', {FALLBACK_FONTS};
             letter-spacing: 1px;
         """)
+        title.setFont(_dream_mecha_font())
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
@@ -1793,14 +2047,7 @@ class BlockmakerWindow(QMainWindow):
         
         # Grid controls from original blockmaker
         controls_frame = QFrame()
-        controls_frame.setStyleSheet(f"""
-            QFrame {{
-                background: {UPGRADE_BG};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 5px;
-                padding: 10px;
-            }}
-        """)
+        controls_frame.setStyleSheet(_PANEL_FRAME_QSS)
         controls_layout = QVBoxLayout(controls_frame)
         
         # Block count controls
@@ -1812,16 +2059,7 @@ class BlockmakerWindow(QMainWindow):
         self.unique_count_spinbox = QSpinBox()
         self.unique_count_spinbox.setRange(1, 144)
         self.unique_count_spinbox.setValue(1)
-        self.unique_count_spinbox.setStyleSheet(f"""
-            QSpinBox {{
-                background: {TAB_BG};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 3px;
-                padding: 5px;
-                color: {TEXT_COLOR};
-                min-width: 80px;
-            }}
-        """)
+        self.unique_count_spinbox.setProperty("role", "panel")
         count_layout.addWidget(self.unique_count_spinbox)
         
         controls_layout.addLayout(count_layout)
@@ -1848,19 +2086,12 @@ class BlockmakerWindow(QMainWindow):
         button_layout.addWidget(self.unique_clear_btn)
         
         controls_layout.addLayout(button_layout)
-        
-        left_layout.addWidget(controls_frame)
-        
-        # Add the grid
-        grid_frame = QFrame()
-        grid_frame.setStyleSheet(f"""
-            QFrame {{
-                background: {UPGRADE_BG};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 5px;
-                padding: 10px;
-            }}
-        """)
+        
+        left_layout.addWidget(controls_frame)
+        
+        # Add the grid
+        grid_frame = QFrame()
+        grid_frame.setStyleSheet(_PANEL_FRAME_QSS)
         grid_layout = QVBoxLayout(grid_frame)
         
         grid_label = QLabel("Piece Grid")
@@ -1879,22 +2110,7 @@ class BlockmakerWindow(QMainWindow):
         
         # Generation parameters
         gen_group = QGroupBox("Generation Parameters")
-        gen_group.setStyleSheet(f"""
-            QGroupBox {{
-                background: {UPGRADE_BG};
-                border: 2px solid {BORDER_COLOR};
-                border-radius: 5px;
-                padding: 10px;
-                font-weight: bold;
-                color: {TEXT_COLOR};
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: {GOLD};
-            }}
-        """)
+        gen_group.setStyleSheet(_GROUPBOX_QSS)
         gen_layout = QFormLayout(gen_group)
         
         self.unique_stat_type = QComboBox()
@@ -1911,19 +2127,7 @@ class BlockmakerWindow(QMainWindow):
         gen_layout.addRow("Stat Type:", self.unique_stat_type)
         
         self.unique_generate_btn = QPushButton("Generate Unique Piece")
-        self.unique_generate_btn.setStyleSheet(f"""
-            QPushButton {{ 
-                background: {GOLD}; 
-                color: #000000; 
-                border: none; 
-                border-radius: 5px; 
-                padding: 12px 20px; 
-                font-weight: bold; 
-                font-size: 14px;
-            }}
-            QPushButton:hover {{ background: #ffd700; }}
-            QPushButton:pressed {{ background: #e6c200; }}
-        """)
+        self.unique_generate_btn.setProperty("role", "gold")
         self.unique_generate_btn.clicked.connect(self.generate_unique_piece)
         gen_layout.addRow("", self.unique_generate_btn)
         
@@ -1949,36 +2153,14 @@ class BlockmakerWindow(QMainWindow):
         
         # Preview area
         preview_group = QGroupBox("Unique Piece Preview")
-        preview_group.setStyleSheet(f"""
-            QGroupBox {{
-                background: {UPGRADE_BG};
-                border: 2px solid {BORDER_COLOR};
-                border-radius: 5px;
-                padding: 10px;
-                font-weight: bold;
-                color: {TEXT_COLOR};
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: {GOLD};
-            }}
-        """)
+        preview_group.setStyleSheet(_GROUPBOX_QSS)
         preview_layout = QVBoxLayout(preview_group)
         
-        self.unique_preview_text = QTextEdit()
-        self.unique_preview_text.setStyleSheet(f"""
-            QTextEdit {{
-                background: {TAB_BG};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 3px;
-                padding: 5px;
-                color: {TEXT_COLOR};
-                font-family: '{DREAM_MECHA_FONT}', {FALLBACK_FONTS};
-                font-size: 11px;
-            }}
-        """)
+        self.unique_preview_text = QPlainTextEdit()  # Plain-text document, no rich text layout
+        self.unique_preview_text.setProperty("role", "preview")
+        self.unique_preview_text.setFont(_dream_mecha_font())
+        self.unique_preview_text.setUndoRedoEnabled(False)
+        self.unique_preview_text.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.unique_preview_text.setMinimumHeight(300)
         preview_layout.addWidget(self.unique_preview_text)
         
@@ -1989,7 +2171,7 @@ class BlockmakerWindow(QMainWindow):
         
         layout.addWidget(main_splitter)
         
-        self.tab_widget.addTab(unique_widget, "Unique Pieces")
+        return unique_widget
     
     def create_gate_tab(self):
         """Create the GATE tab"""
@@ -2008,9 +2190,9 @@ class BlockmakerWindow(QMainWindow):
             font-weight: bold;
             color: {GOLD};
             margin-bottom: 10px;
-            font-family: '{DREAM_MECHA_FONT}', {FALLBACK_FONTS};
             letter-spacing: 1px;
         """)
+        title.setFont(_dream_mecha_font())
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
@@ -2024,12 +2206,7 @@ class BlockmakerWindow(QMainWindow):
         main_splitter = QSplitter(Qt.Orientation.Horizontal)
         main_splitter.setChildrenCollapsible(False)
         main_splitter.setHandleWidth(3)
-        main_splitter.setStyleSheet(f"""
-            QSplitter::handle {{
-                background: {BORDER_COLOR};
-                border-radius: 1px;
-            }}
-        """)
+        main_splitter.setProperty("role", "panel")
         
         # Left side - Grid and Controls
         left_widget = QWidget()
@@ -2043,18 +2220,12 @@ class BlockmakerWindow(QMainWindow):
         
         # Create a dedicated grid for GATE tab (don't share with blockmaker)
         self.gate_grid = BlockmakerGrid(grid_size=12)
+        self.gate_grid.place_block_requested.connect(self.handle_gate_place_block)
         left_layout.addWidget(self.gate_grid)
         
         # Controls section
         controls_frame = QFrame()
-        controls_frame.setStyleSheet(f"""
-            QFrame {{
-                background: {UPGRADE_BG};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 5px;
-                padding: 10px;
-            }}
-        """)
+        controls_frame.setStyleSheet(_PANEL_FRAME_QSS)
         controls_layout = QVBoxLayout(controls_frame)
         
         # Password input
@@ -2066,6 +2237,7 @@ class BlockmakerWindow(QMainWindow):
         self.password_input = QLineEdit()
         self.password_input.setPlaceholderText("Enter password for additional entropy...")
         self.password_input.setEchoMode(QLineEdit.Password)
+        self.password_input.setFont(_dream_mecha_font())
         self.password_input.setStyleSheet(f"""
             QLineEdit {{
                 background: {TAB_BG};
@@ -2073,7 +2245,6 @@ class BlockmakerWindow(QMainWindow):
                 border-radius: 3px;
                 padding: 5px;
                 color: {TEXT_COLOR};
-                font-family: '{DREAM_MECHA_FONT}', {FALLBACK_FONTS};
             }}
         """)
         password_layout.addWidget(self.password_input)
@@ -2082,20 +2253,7 @@ class BlockmakerWindow(QMainWindow):
         
         # Generate GATE button
         generate_gate_btn = QPushButton("🚪 Create GATE from Glyph")
-        generate_gate_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {GOLD};
-                color: #000000;
-                border: none;
-                border-radius: 5px;
-                padding: 12px 24px;
-                font-weight: bold;
-                font-size: 14px;
-            }}
-            QPushButton:hover {{
-                background: #ffd700;
-            }}
-        """)
+        generate_gate_btn.setProperty("role", "gate")
         generate_gate_btn.clicked.connect(self.generate_gate_from_glyph)
         controls_layout.addWidget(generate_gate_btn)
         
@@ -2114,17 +2272,8 @@ class BlockmakerWindow(QMainWindow):
         
         # GATE display
         self.gate_display = QTextEdit()
-        self.gate_display.setStyleSheet(f"""
-            QTextEdit {{
-                background: {TAB_BG};
-                border: 2px solid {BORDER_COLOR};
-                border-radius: 5px;
-                padding: 10px;
-                color: {TEXT_COLOR};
-                font-family: '{DREAM_MECHA_FONT}', {FALLBACK_FONTS};
-                font-size: 11px;
-            }}
-        """)
+        self.gate_display.setProperty("role", "gate")
+        self.gate_display.setFont(_dream_mecha_font())
         self.gate_display.setMaximumHeight(150)
         right_layout.addWidget(self.gate_display)
         
@@ -2141,27 +2290,15 @@ class BlockmakerWindow(QMainWindow):
                 border-radius: 5px;
                 padding: 10px;
                 color: {TEXT_COLOR};
-                font-family: '{DREAM_MECHA_FONT}', {FALLBACK_FONTS};
                 font-size: 10px;
             }}
         """)
+        self.gate_info.setFont(_dream_mecha_font())
         right_layout.addWidget(self.gate_info)
         
         # Copy GATE button
         copy_gate_btn = QPushButton("Copy GATE Data to Clipboard")
-        copy_gate_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {SECONDARY_ACCENT};
-                color: #fff;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background: #8ea6f8;
-            }}
-        """)
+        copy_gate_btn.setProperty("role", "secondary")
         copy_gate_btn.clicked.connect(self.copy_gate_data)
         right_layout.addWidget(copy_gate_btn)
         
@@ -2178,14 +2315,7 @@ class BlockmakerWindow(QMainWindow):
         
         # Portal controls
         portal_controls_frame = QFrame()
-        portal_controls_frame.setStyleSheet(f"""
-            QFrame {{
-                background: {UPGRADE_BG};
-                border: 1px solid {BORDER_COLOR};
-                border-radius: 5px;
-                padding: 10px;
-            }}
-        """)
+        portal_controls_frame.setStyleSheet(_PANEL_FRAME_QSS)
         portal_controls_layout = QVBoxLayout(portal_controls_frame)
         
         # Symbol selection
@@ -2195,7 +2325,7 @@ class BlockmakerWindow(QMainWindow):
         symbol_layout.addWidget(symbol_label)
         
         self.portal_symbol_combo = QComboBox()
-        self.portal_symbol_combo.addItems(['!', '@', '#', '$', '%', '^', '&', '*', '(', ')', '_', '+', '-', '=', '[', ']', '{', '}', '|', ';', ':', ',', '.', '<', '>', '?', '/', '~', '`', '"', "'", '\\'])
+        self.portal_symbol_combo.addItems(_PORTAL_SYMBOLS)
         self.portal_symbol_combo.setStyleSheet(f"""
             QComboBox {{
                 background: {TAB_BG};
@@ -2210,19 +2340,7 @@ class BlockmakerWindow(QMainWindow):
         
         # Random symbol button
         random_portal_symbol_btn = QPushButton("Random Symbol")
-        random_portal_symbol_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {SECONDARY_ACCENT};
-                color: #fff;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background: #8ea6f8;
-            }}
-        """)
+        random_portal_symbol_btn.setProperty("role", "secondary")
         random_portal_symbol_btn.clicked.connect(self.set_random_portal_symbol)
         symbol_layout.addWidget(random_portal_symbol_btn)
         
@@ -2236,9 +2354,13 @@ class BlockmakerWindow(QMainWindow):
         
         self.integration_combo = QComboBox()
         if GATE_PORTAL_AVAILABLE:
-            integration_types = get_integration_types()
-            for code, name in integration_types.items():
-                self.integration_combo.addItem(f"{code}: {name}", code)
+            # Fill a detached model and attach it once instead of N addItem() resets
+            integration_model = QStandardItemModel(self.integration_combo)
+            for code, name in get_integration_types().items():
+                item = QStandardItem(f"{code}: {name}")
+                item.setData(code, Qt.UserRole)
+                integration_model.appendRow(item)
+            self.integration_combo.setModel(integration_model)
         else:
             self.integration_combo.addItem("GATE Portal not available")
         self.integration_combo.setStyleSheet(f"""
@@ -2257,20 +2379,7 @@ class BlockmakerWindow(QMainWindow):
         
         # Generate portal button
         generate_portal_btn = QPushButton("Generate GATE Portal")
-        generate_portal_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {GOLD};
-                color: #000000;
-                border: none;
-                border-radius: 5px;
-                padding: 12px 24px;
-                font-weight: bold;
-                font-size: 14px;
-            }}
-            QPushButton:hover {{
-                background: #ffd700;
-            }}
-        """)
+        generate_portal_btn.setProperty("role", "gate")
         generate_portal_btn.clicked.connect(self.generate_gate_portal)
         portal_controls_layout.addWidget(generate_portal_btn)
         
@@ -2282,35 +2391,14 @@ class BlockmakerWindow(QMainWindow):
         right_layout.addWidget(portal_display_label)
         
         self.portal_display = QTextEdit()
-        self.portal_display.setStyleSheet(f"""
-            QTextEdit {{
-                background: {TAB_BG};
-                border: 2px solid {BORDER_COLOR};
-                border-radius: 5px;
-                padding: 10px;
-                color: {TEXT_COLOR};
-                font-family: '{DREAM_MECHA_FONT}', {FALLBACK_FONTS};
-                font-size: 11px;
-            }}
-        """)
+        self.portal_display.setProperty("role", "gate")
+        self.portal_display.setFont(_dream_mecha_font())
         self.portal_display.setMaximumHeight(100)
         right_layout.addWidget(self.portal_display)
         
         # Copy portal button
         copy_portal_btn = QPushButton("Copy Portal Code to Clipboard")
-        copy_portal_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {SECONDARY_ACCENT};
-                color: #fff;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background: #8ea6f8;
-            }}
-        """)
+        copy_portal_btn.setProperty("role", "secondary")
         copy_portal_btn.clicked.connect(self.copy_gate_portal)
         right_layout.addWidget(copy_portal_btn)
         
@@ -2320,8 +2408,34 @@ class BlockmakerWindow(QMainWindow):
         main_splitter.setSizes([400, 400])
         
         layout.addWidget(main_splitter)
-        self.tab_widget.addTab(gate_tab_widget, "GATE")
         print("GATE tab added to widget")
+        return gate_tab_widget
+    
+    def _add_deferred_tab(self, title: str, builder):
+        """Add a placeholder tab whose contents are built on first activation"""
+        placeholder = QWidget()
+        self._deferred_tabs[placeholder] = builder
+        self.tab_widget.addTab(placeholder, title)
+    
+    def _ensure_tab_built(self, index: int):
+        """Swap a placeholder tab for its real contents the first time it is shown"""
+        placeholder = self.tab_widget.widget(index)
+        builder = self._deferred_tabs.get(placeholder)
+        if builder is None:
+            return
+        title = self.tab_widget.tabText(index)
+        try:
+            widget = builder()
+        except Exception as e:
+            # Keep the placeholder registered so the next visit retries the build
+            self.log_debug(f"Error building {title} tab: {e}")
+            return
+        del self._deferred_tabs[placeholder]
+        with QSignalBlocker(self.tab_widget):
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, widget, title)
+            self.tab_widget.setCurrentIndex(index)
+        placeholder.deleteLater()
     
     def setup_connections(self):
         """Setup signal connections"""
@@ -2332,9 +2446,6 @@ class BlockmakerWindow(QMainWindow):
         if self.grid:
             # Use a custom handler to increment block number for each placement
             self.grid.place_block_requested.connect(self.handle_place_block)
-        if hasattr(self, 'gate_grid') and self.gate_grid:
-            # Connect gate grid to the same handler
-            self.gate_grid.place_block_requested.connect(self.handle_gate_place_block)
         if self.random_btn:
             self.random_btn.clicked.connect(self.generate_random_pattern)
             self.random_btn.setShortcut(QKeySequence("Ctrl+R"))
@@ -2362,15 +2473,14 @@ class BlockmakerWindow(QMainWindow):
             center = self.grid.grid_size // 2
             self.grid.add_block((center, center), 1)
             self.block_count = 2
-            self.count_spinbox.setValue(self.block_count)
+            self._set_count_spinbox(self.block_count)
             self.status_label.setText(f"First block (+) placed! Click to place block {self.block_count}")
             self.log_debug(f"First block placed at center ({center}, {center})")
         else:
             self.block_count = self.count_spinbox.value()
             self.status_label.setText(f"Click on a highlighted position to place block {self.block_count}")
             self.log_debug(f"Manual placement mode: {len(self.grid.valid_positions)} valid positions")
-        self.update_debug_log()
-        self.update_clipboard_pattern()
+        self._schedule_ui_refresh()
     
     def handle_place_block(self, pos: Tuple[int, int]):
         """Place a block at the specified position with strict sequential numbering (no repeats, no overwrites)."""
@@ -2381,12 +2491,12 @@ class BlockmakerWindow(QMainWindow):
             self.log_debug("Maximum block limit reached")
             return
         # Only place a block if the cell is not already filled
-        if pos not in self.grid.blocks:
+        if not self.grid.occupied[pos[0] * self.grid.grid_size + pos[1]]:
             # If grid is empty, always start with 1 (+)
             if not self.grid.blocks:
                 self.grid.add_block(pos, 1)
                 self.block_count = 2
-                self.count_spinbox.setValue(self.block_count)
+                self._set_count_spinbox(self.block_count)
                 self.status_label.setText(f"First block (+) placed! Click to place block {self.block_count}")
                 self.log_debug(f"First block placed at {pos}")
             else:
@@ -2394,17 +2504,15 @@ class BlockmakerWindow(QMainWindow):
                 self.flash_block(pos)
                 self.log_debug(f"Block {self.block_count} placed at position {pos}")
                 self.block_count += 1
-                self.count_spinbox.setValue(self.block_count)
+                self._set_count_spinbox(self.block_count)
                 if self.grid.valid_positions and len(self.grid.blocks) < 144:
                     self.status_label.setText(f"Block {self.block_count-1} placed! Click to place block {self.block_count}")
                 else:
                     self.status_label.setText("Grid full! Clear to start over.")
                     self.log_debug("Grid is now full")
             # Clear the processing flag for this position
-            if hasattr(self.grid, '_processing_positions'):
-                self.grid._processing_positions.discard(pos)
-            self.update_debug_log()
-            self.update_clipboard_pattern()
+            self.grid._processing_cells[pos[0] * self.grid.grid_size + pos[1]] = 0
+            self._schedule_ui_refresh()
         # If cell is already filled, do nothing (no increment, no overwrite)
     
     def handle_gate_place_block(self, pos: Tuple[int, int]):
@@ -2414,7 +2522,7 @@ class BlockmakerWindow(QMainWindow):
         if len(self.gate_grid.blocks) >= 144:
             return
         # Only place a block if the cell is not already filled
-        if pos not in self.gate_grid.blocks:
+        if not self.gate_grid.occupied[pos[0] * self.gate_grid.grid_size + pos[1]]:
             # If grid is empty, always start with 1 (+)
             if not self.gate_grid.blocks:
                 self.gate_grid.add_block(pos, 1)
@@ -2423,6 +2531,11 @@ class BlockmakerWindow(QMainWindow):
                 self.gate_grid.add_block(pos, self.gate_block_count)
                 self.gate_block_count += 1
     
+    def _set_count_spinbox(self, value: int):
+        """Show a count in the spinbox without emitting valueChanged for programmatic updates"""
+        with QSignalBlocker(self.count_spinbox):
+            self.count_spinbox.setValue(value)
+    
     def clear_grid(self, reset_spinbox=True):
         """Clear the entire grid"""
         if not self.grid:
@@ -2431,11 +2544,10 @@ class BlockmakerWindow(QMainWindow):
         self.grid.clear_grid(reset_spinbox)
         self.block_count = 1
         if reset_spinbox and self.count_spinbox:
-            self.count_spinbox.setValue(1)
+            self._set_count_spinbox(1)
         self.status_label.setText("Grid cleared. Ready to create blocks.")
         self.log_debug("Grid cleared")
-        self.update_debug_log()
-        self.update_clipboard_pattern()
+        self._schedule_ui_refresh()
     
     def generate_random_pattern(self):
         """Randomly generate a block pattern following blockmaker rules"""
@@ -2453,19 +2565,31 @@ class BlockmakerWindow(QMainWindow):
         block_num = 2
         self.log_debug(f"Random: Placed block 1 at ({center}, {center})")
         
-        # Continue placing blocks until target is reached, grid is full, or 12x12 limit
-        while blocks_placed < target_blocks and self.grid.valid_positions and len(self.grid.blocks) < 144:
-            pos = random.choice(list(self.grid.valid_positions))
-            self.grid.add_block(pos, block_num)
-            self.grid.update_valid_positions()  # Explicitly update valid positions
-            self.log_debug(f"Random: Placed block {block_num} at {pos}")
-            self.log_debug(f"Random: Valid positions after block {block_num}: {len(self.grid.valid_positions)}")
-            blocks_placed += 1
-            block_num += 1
+        # Continue placing blocks until target is reached, grid is full, or 12x12 limit.
+        # Repaints are held off until the whole pattern is in and the per-block
+        # log lines go out as one append.
+        placements = []
+        self.grid.setUpdatesEnabled(False)
+        try:
+            while blocks_placed < target_blocks and self.grid.valid_positions and len(self.grid.blocks) < 144:
+                pos = self.grid.random_valid_position()
+                self.grid.add_block(pos, block_num)  # Also extends valid positions
+                placements.append((block_num, pos, len(self.grid.valid_positions)))
+                blocks_placed += 1
+                block_num += 1
+        finally:
+            self.grid.setUpdatesEnabled(True)
+            self.grid.update()
+        if placements and not self.debug_text.isHidden():
+            self.log_debug("\n".join(
+                f"Random: Placed block {num} at {pos}\n"
+                f"Random: Valid positions after block {num}: {valid_count}"
+                for num, pos, valid_count in placements
+            ))
         
         # Update UI state - set to next block number for manual placement
         self.block_count = block_num
-        self.count_spinbox.setValue(target_blocks)  # Keep the original target count
+        self._set_count_spinbox(target_blocks)  # Keep the original target count
         
         if blocks_placed == target_blocks:
             self.status_label.setText(f"Random pattern generated with {blocks_placed} blocks!")
@@ -2473,30 +2597,62 @@ class BlockmakerWindow(QMainWindow):
             self.status_label.setText(f"Grid full! Generated {blocks_placed} blocks (max possible).")
         
         # Update debug log and clipboard
-        self.update_debug_log()
-        self.update_clipboard_pattern()
+        self._schedule_ui_refresh()
     
     def log_debug(self, message: str):
         """Add a message to the debug log"""
-        if not self.debug_text:
-            return
+        if not self.debug_text or self.debug_text.isHidden():
+            return  # Pane toggled off - skip the text layout work
             
-        timestamp = QTimer().remainingTime() if hasattr(QTimer(), 'remainingTime') else "N/A"
-        self.debug_text.appendPlainText(f"[{timestamp}] {message}")
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self._debug_buf.append(f"[{timestamp}] {message}")
+        if not self._debug_timer.isActive():
+            self._debug_timer.start()
+    
+    def _flush_debug_log(self):
+        """Append all buffered debug messages with a single layout pass"""
+        if not self._debug_buf:
+            return
+        self.debug_text.appendPlainText("\n".join(self._debug_buf))
+        self._debug_buf.clear()
         # Auto-scroll to bottom
         scrollbar = self.debug_text.verticalScrollBar()
         if scrollbar:
             scrollbar.setValue(scrollbar.maximum())
     
+    def _schedule_ui_refresh(self):
+        """Queue a debug log + clipboard refresh for the next event-loop turn.
+        
+        Rapid successive placements (generators, mirrors, drag placement)
+        collapse into a single refresh instead of one per call.
+        """
+        if self._ui_refresh_scheduled:
+            return
+        self._ui_refresh_scheduled = True
+        QTimer.singleShot(0, self._do_ui_refresh)
+    
+    def _do_ui_refresh(self):
+        """Run the refresh queued by _schedule_ui_refresh"""
+        self._ui_refresh_scheduled = False
+        self.update_debug_log()
+        self.update_clipboard_pattern()
+    
     def update_debug_log(self):
         """Update debug log with current grid state"""
-        if not self.grid:
+        if not self.grid or not self.debug_text or self.debug_text.isHidden():
             return
             
-        self.log_debug(f"Grid state: {len(self.grid.blocks)} blocks placed")
-        if self.grid.blocks:
-            positions = list(self.grid.blocks.keys())
-            self.log_debug(f"Block positions: {positions}")
+        blocks = self.grid.blocks
+        logged = self._logged_positions
+        self.log_debug(f"Grid state: {len(blocks)} blocks placed")
+        added = [pos for pos in blocks if pos not in logged]
+        if len(logged) + len(added) != len(blocks):
+            # Blocks were removed (grid cleared/restored) - start the delta over
+            logged.clear()
+            added = list(blocks)
+        logged.update(added)
+        if added:
+            self.log_debug(f"Added: {added}")
         if self.grid.valid_positions:
             valid_count = len(self.grid.valid_positions)
             self.log_debug(f"Valid positions: {valid_count}")
@@ -2505,92 +2661,57 @@ class BlockmakerWindow(QMainWindow):
         """Generate and update clipboard pattern text"""
         if not self.grid or not self.clipboard_text:
             return
+        if not self.clipboard_text.isVisible():
+            # Off screen (other tab, minimised) - render when it is shown again
+            self._clipboard_dirty = True
+            return
+        self._clipboard_dirty = False
             
         if not self.grid.blocks:
-            self.clipboard_text.setPlainText("No blocks placed")
+            self._last_pattern_text = "No blocks placed"
+            self.clipboard_text.setPlainText(self._last_pattern_text)
             return
         
         # Create ASCII representation of the pattern
         pattern = self.generate_ascii_pattern()
+        if pattern == self._last_pattern_text:
+            return  # Unchanged - skip the document rebuild
+        self._last_pattern_text = pattern  # Reused by copy_to_clipboard
         self.clipboard_text.setPlainText(pattern)
     
+    def eventFilter(self, obj, event):
+        """Refresh a stale clipboard pattern when its pane becomes visible"""
+        if obj is self.clipboard_text and event.type() == QEvent.Show and self._clipboard_dirty:
+            self.update_clipboard_pattern()
+        return super().eventFilter(obj, event)
+    
     def generate_ascii_pattern(self) -> str:
         """Generate ASCII representation of the block pattern, never show -999 (flash value)"""
         if not self.grid or not self.grid.blocks:
             return "No blocks placed"
-        min_row = min(pos[0] for pos in self.grid.blocks.keys())
-        max_row = max(pos[0] for pos in self.grid.blocks.keys())
-        min_col = min(pos[1] for pos in self.grid.blocks.keys())
-        max_col = max(pos[1] for pos in self.grid.blocks.keys())
-        pattern_lines = []
-        pattern_lines.append(f"Block Pattern ({len(self.grid.blocks)} blocks):")
-        pattern_lines.append("=" * 30)
-        for row in range(min_row, max_row + 1):
-            line = ""
-            for col in range(min_col, max_col + 1):
-                if (row, col) in self.grid.blocks:
-                    block_num = self.grid.blocks[(row, col)]
-                    if block_num == -999:
-                        line += ". "  # treat flash as empty
-                    elif block_num == 1:
-                        line += "+ "
-                    else:
-                        line += f"{block_num} "
-                else:
-                    line += ". "
-            pattern_lines.append(line.rstrip())
-        return "\n".join(pattern_lines)
+        version, text = self._pattern_cache
+        if version == self.grid.blocks_version:
+            return text
+        blocks = self.grid.blocks
+        pattern_lines = [f"Block Pattern ({len(blocks)} blocks):", "=" * 30]
+        pattern_lines.extend(_pattern_rows(blocks))
+        text = "\n".join(pattern_lines)
+        self._pattern_cache = (self.grid.blocks_version, text)
+        return text
 
     def generate_clean_pattern(self) -> str:
         """Generate clean pattern without headers for data export"""
         if not self.grid or not self.grid.blocks:
             return ""
-        min_row = min(pos[0] for pos in self.grid.blocks.keys())
-        max_row = max(pos[0] for pos in self.grid.blocks.keys())
-        min_col = min(pos[1] for pos in self.grid.blocks.keys())
-        max_col = max(pos[1] for pos in self.grid.blocks.keys())
-        pattern_lines = []
-        for row in range(min_row, max_row + 1):
-            line = ""
-            for col in range(min_col, max_col + 1):
-                if (row, col) in self.grid.blocks:
-                    block_num = self.grid.blocks[(row, col)]
-                    if block_num == -999:
-                        line += "."  # treat flash as empty
-                    elif block_num == 1:
-                        line += "+"
-                    else:
-                        line += str(block_num)
-                else:
-                    line += "."
-            pattern_lines.append(line.rstrip())
-        return "\n".join(pattern_lines)
+        return "\n".join(_pattern_rows(self.grid.blocks, _clean_block_token, "."))
 
     def generate_gate_ascii_pattern(self) -> str:
         """Generate ASCII representation of the gate grid pattern"""
         if not self.gate_grid or not self.gate_grid.blocks:
             return "No blocks placed"
-        min_row = min(pos[0] for pos in self.gate_grid.blocks.keys())
-        max_row = max(pos[0] for pos in self.gate_grid.blocks.keys())
-        min_col = min(pos[1] for pos in self.gate_grid.blocks.keys())
-        max_col = max(pos[1] for pos in self.gate_grid.blocks.keys())
-        pattern_lines = []
-        pattern_lines.append(f"Block Pattern ({len(self.gate_grid.blocks)} blocks):")
-        pattern_lines.append("=" * 30)
-        for row in range(min_row, max_row + 1):
-            line = ""
-            for col in range(min_col, max_col + 1):
-                if (row, col) in self.gate_grid.blocks:
-                    block_num = self.gate_grid.blocks[(row, col)]
-                    if block_num == -999:
-                        line += ". "  # treat flash as empty
-                    elif block_num == 1:
-                        line += "+ "
-                    else:
-                        line += f"{block_num} "
-                else:
-                    line += ". "
-            pattern_lines.append(line.rstrip())
+        blocks = self.gate_grid.blocks
+        pattern_lines = [f"Block Pattern ({len(blocks)} blocks):", "=" * 30]
+        pattern_lines.extend(_pattern_rows(blocks))
         return "\n".join(pattern_lines)
     
     def copy_to_clipboard(self):
@@ -2598,10 +2719,11 @@ class BlockmakerWindow(QMainWindow):
         if not self.clipboard_text:
             return
             
-        pattern_text = self.clipboard_text.toPlainText()
-        clipboard = QApplication.clipboard()
-        if clipboard:
-            clipboard.setText(pattern_text)
+        if self._clipboard_dirty:
+            self._last_pattern_text = self.generate_ascii_pattern() if self.grid.blocks else "No blocks placed"
+        pattern_text = self._last_pattern_text or self.clipboard_text.toPlainText()
+        if self._clipboard:
+            self._clipboard.setText(pattern_text)
         self.status_label.setText("Pattern copied to clipboard!")
         self.log_debug("Pattern copied to clipboard")
 
@@ -2610,33 +2732,24 @@ class BlockmakerWindow(QMainWindow):
         if not self.debug_text or not self.debug_toggle_btn:
             return
             
+        # Checked means the pane is hidden (button starts unchecked as "Hide Debug")
         if self.debug_toggle_btn.isChecked():
             self.debug_text.hide()
+            self._debug_buf.clear()  # Same as lines logged while hidden - dropped
+            self._logged_positions.clear()  # Re-list every block once the pane is back
             self.debug_toggle_btn.setText("Show Debug")
         else:
             self.debug_text.show()
             self.debug_toggle_btn.setText("Hide Debug")
+            self._schedule_ui_refresh()  # Catch up on state skipped while hidden
 
     def flash_block(self, pos: Tuple[int, int]):
         """Flash a block for visual feedback"""
         if not self.grid:
             return
-            
-        import threading
-        from PyQt5.QtCore import QTimer
-        orig_color = GOLD
-        flash_color = "#fffbe6"
-        row, col = pos
-        # Store the original block number before flashing
-        original_block_num = self.grid.blocks[pos]
-        # Temporarily override the block color
-        self.grid.blocks[pos] = -999  # Use a special value
-        self.grid.update()
-        def restore():
-            if self.grid:
-                self.grid.blocks[pos] = original_block_num  # Restore original number
-                self.grid.update()
-        QTimer.singleShot(200, restore)
+        # Overlay only - the block keeps its number, so the pattern text and
+        # cached block layer are untouched while it flashes
+        self.grid.flash_cell(pos)
 
     def generate_stars_pattern(self):
         """Generate a stars pattern with hybrid rules: attraction, mirroring, and symmetry breaks"""
@@ -2648,75 +2761,97 @@ class BlockmakerWindow(QMainWindow):
         self.clear_grid(reset_spinbox=False)  # Don't reset spinbox here
         
         # Place first block in center - always number as 1 (displays as "+")
-        center = self.grid.grid_size // 2
-        self.grid.add_block((center, center), 1)  # Always use 1 for first block
+        grid_size = self.grid.grid_size
+        occupied = self.grid.occupied
+        add_block = self.grid.add_block
+        rng_random = random.random
+        rng_choice = random.choice
+        rng_randrange = random.randrange
+        log_debug = self.log_debug
+        center = grid_size // 2
+        add_block((center, center), 1)  # Always use 1 for first block
         blocks_placed = 1
         block_num = 2
         last_pos = (center, center)  # Track the last block position
         mirror_target = None  # Track position to mirror from
         mirror_direction = None  # Track which direction to mirror
         
-        self.log_debug(f"Stars: Placed block 1 at ({center}, {center})")
+        log_debug(f"Stars: Placed block 1 at ({center}, {center})")
         
-        # Continue placing blocks until target is reached, grid is full, or 12x12 limit
-        while blocks_placed < target_blocks and len(self.grid.blocks) < 144:
-            # Get all available positions (no adjacency requirement for stars)
-            available_positions = []
-            for row in range(self.grid.grid_size):
-                for col in range(self.grid.grid_size):
-                    if (row, col) not in self.grid.blocks:
-                        available_positions.append((row, col))
-            
-            if not available_positions:
-                break
+        # All available positions (no adjacency requirement for stars), kept in
+        # row-major order and trimmed as blocks land instead of rescanning the grid.
+        # Random picks pop by index; targeted picks are found with bisect.
+        available_positions = [divmod(i, grid_size) for i, taken in enumerate(occupied) if not taken]
+        
+        # Per-block log lines are kept as (template, args) and formatted in one
+        # append after the loop
+        placements = []
+        log_placement = placements.append
+        
+        # Continue placing blocks until target is reached or grid is full
+        cap = min(target_blocks, grid_size * grid_size)
+        self.grid.setUpdatesEnabled(False)  # One repaint once the pattern is in
+        try:
+            while blocks_placed < cap:
+                if not available_positions:
+                    break
+                    
+                # Determine placement strategy
+                if mirror_target and mirror_direction and rng_random() > 0.2:  # 80% chance to follow mirror rule
+                    # Mirror in the specified direction
+                    pos = self.calculate_mirror_position(mirror_target, mirror_direction)
+                    if not occupied[pos[0] * grid_size + pos[1]]:
+                        del available_positions[bisect.bisect_left(available_positions, pos)]
+                        add_block(pos, block_num)
+                        log_placement(("Stars: Placed block {0} at mirrored {1} ({2} from {3})", block_num, pos, mirror_direction, mirror_target))
+                    else:
+                        # Fallback to random if mirrored position not available
+                        pos = available_positions.pop(rng_randrange(len(available_positions)))
+                        add_block(pos, block_num)
+                        log_placement(("Stars: Placed block {0} at random {1} (mirrored position not available)", block_num, pos))
+                    mirror_target = None  # Reset mirror after use
+                    mirror_direction = None
                 
-            # Determine placement strategy
-            if mirror_target and mirror_direction and random.random() > 0.2:  # 80% chance to follow mirror rule
-                # Mirror in the specified direction
-                pos = self.calculate_mirror_position(mirror_target, mirror_direction)
-                if pos in available_positions:
-                    self.grid.add_block(pos, block_num)
-                    self.log_debug(f"Stars: Placed block {block_num} at mirrored {pos} ({mirror_direction} from {mirror_target})")
-                else:
-                    # Fallback to random if mirrored position not available
-                    pos = random.choice(available_positions)
-                    self.grid.add_block(pos, block_num)
-                    self.log_debug(f"Stars: Placed block {block_num} at random {pos} (mirrored position not available)")
-                mirror_target = None  # Reset mirror after use
-                mirror_direction = None
+                elif rng_random() < 0.4:  # 40% chance of attraction
+                    # Place adjacent to last block
+                    row, col = last_pos
+                    valid_adjacent = [(row + dr, col + dc) for dr, dc in _DIRS
+                                      if 0 <= row + dr < grid_size and 0 <= col + dc < grid_size
+                                      and not occupied[(row + dr) * grid_size + col + dc]]
+                    
+                    if valid_adjacent:
+                        pos = rng_choice(valid_adjacent)
+                        del available_positions[bisect.bisect_left(available_positions, pos)]
+                        add_block(pos, block_num)
+                        
+                        # Set up mirroring for next block
+                        mirror_target = pos
+                        mirror_direction = rng_choice(['N', 'E', 'S', 'W'])
+                        log_placement(("Stars: Placed block {0} at attracted {1} (adjacent to {2})\n"
+                                       "Stars: Next block will mirror {3} from {1}", block_num, pos, last_pos, mirror_direction))
+                    else:
+                        # Fallback to random if no valid adjacent positions
+                        pos = available_positions.pop(rng_randrange(len(available_positions)))
+                        add_block(pos, block_num)
+                        log_placement(("Stars: Placed block {0} at random {1} (no valid adjacent positions)", block_num, pos))
                 
-            elif random.random() < 0.4:  # 40% chance of attraction
-                # Place adjacent to last block
-                adjacent_positions = self.get_adjacent_positions(last_pos)
-                valid_adjacent = [pos for pos in adjacent_positions if pos in available_positions]
+                else:  # Random placement
+                    pos = available_positions.pop(rng_randrange(len(available_positions)))
+                    add_block(pos, block_num)
+                    log_placement(("Stars: Placed block {0} at random {1}", block_num, pos))
                 
-                if valid_adjacent:
-                    pos = random.choice(valid_adjacent)
-                    self.grid.add_block(pos, block_num)
-                    self.log_debug(f"Stars: Placed block {block_num} at attracted {pos} (adjacent to {last_pos})")
-                    
-                    # Set up mirroring for next block
-                    mirror_target = pos
-                    mirror_direction = random.choice(['N', 'E', 'S', 'W'])
-                    self.log_debug(f"Stars: Next block will mirror {mirror_direction} from {pos}")
-                else:
-                    # Fallback to random if no valid adjacent positions
-                    pos = random.choice(available_positions)
-                    self.grid.add_block(pos, block_num)
-                    self.log_debug(f"Stars: Placed block {block_num} at random {pos} (no valid adjacent positions)")
-                    
-            else:  # Random placement
-                pos = random.choice(available_positions)
-                self.grid.add_block(pos, block_num)
-                self.log_debug(f"Stars: Placed block {block_num} at random {pos}")
-            
-            last_pos = pos
-            blocks_placed += 1
-            block_num += 1
+                last_pos = pos
+                blocks_placed += 1
+                block_num += 1
+        finally:
+            self.grid.setUpdatesEnabled(True)
+            self.grid.update()
+        if placements and not self.debug_text.isHidden():
+            log_debug("\n".join(template.format(*args) for template, *args in placements))
         
         # Update UI state - set to next block number for manual placement
         self.block_count = block_num
-        self.count_spinbox.setValue(target_blocks)  # Keep the original target count
+        self._set_count_spinbox(target_blocks)  # Keep the original target count
         
         if blocks_placed == target_blocks:
             self.status_label.setText(f"Stars pattern generated with {blocks_placed} blocks!")
@@ -2724,34 +2859,15 @@ class BlockmakerWindow(QMainWindow):
             self.status_label.setText(f"Grid full! Generated {blocks_placed} blocks (max possible).")
         
         # Update debug log and clipboard
-        self.update_debug_log()
-        self.update_clipboard_pattern()
-    
-    def get_adjacent_positions(self, pos):
-        """Get all adjacent positions to a given position"""
-        row, col = pos
-        adjacent = []
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:  # N, S, W, E
-            new_row, new_col = row + dr, col + dc
-            if 0 <= new_row < self.grid.grid_size and 0 <= new_col < self.grid.grid_size:
-                adjacent.append((new_row, new_col))
-        return adjacent
+        self._schedule_ui_refresh()
     
     def calculate_mirror_position(self, target_pos, direction):
         """Calculate mirrored position in specified direction"""
-        row, col = target_pos
-        grid_size = self.grid.grid_size
-        
-        if direction == 'N':  # Mirror North (top of grid)
-            return (0, col)
-        elif direction == 'S':  # Mirror South (bottom of grid)
-            return (grid_size - 1, col)
-        elif direction == 'E':  # Mirror East (right of grid)
-            return (row, grid_size - 1)
-        elif direction == 'W':  # Mirror West (left of grid)
-            return (row, 0)
-        else:
+        mirror = _MIRROR.get(direction)
+        if mirror is None:
             return target_pos  # Fallback
+        row, col = target_pos
+        return mirror(row, col, self.grid.grid_size)
 
     def generate_glyph_pattern(self):
         """Generate a glyph pattern: border, 4 inner corners, and multiple random vertical-symmetry rings with empty center."""
@@ -2766,37 +2882,47 @@ class BlockmakerWindow(QMainWindow):
         min_glyph_blocks = 62
         if user_blocks < min_glyph_blocks:
             target_blocks = random.randint(min_glyph_blocks, min(max_possible, min_glyph_blocks + 38))  # e.g. up to 100
-            self.count_spinbox.setValue(target_blocks)
+            self._set_count_spinbox(target_blocks)
         else:
             target_blocks = user_blocks
         self.log_debug(f"[GLYPH] Target block count: {target_blocks}")
         self.clear_grid(reset_spinbox=False)
         
+        self.grid.setUpdatesEnabled(False)  # One repaint once the glyph is in
+        try:
+            block_num, blocks_placed = self._place_glyph_blocks(target_blocks)
+        finally:
+            self.grid.setUpdatesEnabled(True)
+            self.grid.update()
+        self._finalize_glyph(block_num, target_blocks, blocks_placed)
+    
+    def _place_glyph_blocks(self, target_blocks):
+        """Lay out the glyph border, inner corners and rings; returns (next block_num, blocks placed)"""
+        grid_size = self.grid.grid_size
         blocks_placed = 0
         block_num = 1
+        occupied = self.grid.occupied
         center_row = grid_size // 2
         center_col = grid_size // 2
         
         # Step 2: Fill the border (perimeter)
-        perimeter_positions = self.get_grid_perimeter_positions()
+        perimeter_positions = _glyph_perimeter(grid_size)
         for pos in perimeter_positions:
             self.grid.add_block(pos, block_num)
             block_num += 1
             blocks_placed += 1
             if blocks_placed >= target_blocks:
-                self._finalize_glyph(block_num, target_blocks, blocks_placed)
-                return
+                return block_num, blocks_placed
         
         # Step 3: Place the four inner corners
         inner_corners = [(1,1), (1,grid_size-2), (grid_size-2,1), (grid_size-2,grid_size-2)]
         for pos in inner_corners:
-            if pos not in self.grid.blocks:
+            if not occupied[pos[0] * grid_size + pos[1]]:
                 self.grid.add_block(pos, block_num)
                 block_num += 1
                 blocks_placed += 1
                 if blocks_placed >= target_blocks:
-                    self._finalize_glyph(block_num, target_blocks, blocks_placed)
-                    return
+                    return block_num, blocks_placed
         
         # Step 4: Randomly decide if the ring is attached to corners
         attach_ring = random.choice([True, False])
@@ -2809,14 +2935,7 @@ class BlockmakerWindow(QMainWindow):
         used_radii = sorted(possible_radii[:num_rings])
         self.log_debug(f"Glyph: Using radii {used_radii}")
         for ring_radius in used_radii:
-            ring_positions = []
-            for row in range(1, grid_size-1):
-                for col in range(1, grid_size-1):
-                    # Manhattan distance from center
-                    if abs(row - center_row) + abs(col - center_col) == ring_radius:
-                        # For vertical symmetry, only add left half, mirror right
-                        if col <= center_col:
-                            ring_positions.append((row, col))
+            ring_positions = _glyph_ring(grid_size, ring_radius)
             # Randomly skip some positions for variety
             skip_chance = 0.25 if ring_radius > 2 else 0.1
             ring_positions = [pos for pos in ring_positions if random.random() > skip_chance]
@@ -2835,106 +2954,75 @@ class BlockmakerWindow(QMainWindow):
                     continue
                 # Place both pos and its mirror if not already filled
                 for p in [pos, mirror_pos]:
-                    if p not in self.grid.blocks:
+                    if not occupied[p[0] * grid_size + p[1]]:
                         self.grid.add_block(p, block_num)
                         block_num += 1
                         blocks_placed += 1
                         if blocks_placed >= target_blocks:
-                            self._finalize_glyph(block_num, target_blocks, blocks_placed)
-                            return
-        self._finalize_glyph(block_num, target_blocks, blocks_placed)
+                            return block_num, blocks_placed
+        return block_num, blocks_placed
 
     def _finalize_glyph(self, block_num, target_blocks, blocks_placed):
         self.block_count = block_num
         # Always update the spinbox to the actual number of blocks placed (not just the target)
         if self.count_spinbox:
-            self.count_spinbox.setValue(blocks_placed)
+            self._set_count_spinbox(blocks_placed)
         if self.status_label:
             if blocks_placed == target_blocks:
                 self.status_label.setText(f"Glyph pattern generated with {blocks_placed} blocks!")
             else:
                 self.status_label.setText(f"Grid full! Generated {blocks_placed} blocks (max possible).")
-        self.update_debug_log()
-        self.update_clipboard_pattern()
-
-    def get_grid_perimeter_positions(self):
-        """Get all positions around the perimeter of the grid in order"""
-        positions = []
-        grid_size = self.grid.grid_size
-        
-        # Top row (left to right)
-        for col in range(grid_size):
-            positions.append((0, col))
-        
-        # Right column (top to bottom, excluding corners)
-        for row in range(1, grid_size - 1):
-            positions.append((row, grid_size - 1))
-        
-        # Bottom row (right to left, excluding corners)
-        for col in range(grid_size - 1, -1, -1):
-            positions.append((grid_size - 1, col))
-        
-        # Left column (bottom to top, excluding corners)
-        for row in range(grid_size - 2, 0, -1):
-            positions.append((row, 0))
-        
-        return positions
+        self._schedule_ui_refresh()
 
     def mirror_grid_horizontally(self):
         """Mirror the current grid horizontally (across the vertical axis)."""
         if not self.grid:
             return
         grid_size = self.grid.grid_size
-        current_blocks = dict(self.grid.blocks)  # Copy to avoid modifying during iteration
-        next_num = max(current_blocks.values(), default=0) + 1
+        # New blocks are staged and added after the scan, so the dict can be
+        # iterated in place without a copy
+        blocks = self.grid.blocks
+        next_num = max(blocks.values(), default=0) + 1
+        occupied = self.grid.occupied
         new_blocks = []
-        for (row, col), num in current_blocks.items():
+        for row, col in blocks:
             mirror_col = grid_size - 1 - col
-            mirror_pos = (row, mirror_col)
-            if mirror_pos not in self.grid.blocks:
-                new_blocks.append((mirror_pos, next_num))
+            if not occupied[row * grid_size + mirror_col]:
+                new_blocks.append(((row, mirror_col), next_num))
                 next_num += 1
-        for pos, num in new_blocks:
-            self.grid.add_block(pos, num)
+        self.grid.add_blocks(new_blocks)
         self.block_count = next_num
         if self.count_spinbox:
-            self.count_spinbox.setValue(len(self.grid.blocks))
+            self._set_count_spinbox(len(self.grid.blocks))
         self.status_label.setText(f"Mirrored horizontally. Total blocks: {len(self.grid.blocks)}")
-        self.update_debug_log()
-        self.update_clipboard_pattern()
+        self._schedule_ui_refresh()
 
     def mirror_grid_vertically(self):
         """Mirror the current grid vertically (across the horizontal axis)."""
         if not self.grid:
             return
         grid_size = self.grid.grid_size
-        current_blocks = dict(self.grid.blocks)
-        next_num = max(current_blocks.values(), default=0) + 1
+        blocks = self.grid.blocks  # Iterated in place - additions are staged below
+        next_num = max(blocks.values(), default=0) + 1
+        occupied = self.grid.occupied
         new_blocks = []
-        for (row, col), num in current_blocks.items():
+        for row, col in blocks:
             mirror_row = grid_size - 1 - row
-            mirror_pos = (mirror_row, col)
-            if mirror_pos not in self.grid.blocks:
-                new_blocks.append((mirror_pos, next_num))
+            if not occupied[mirror_row * grid_size + col]:
+                new_blocks.append(((mirror_row, col), next_num))
                 next_num += 1
-        for pos, num in new_blocks:
-            self.grid.add_block(pos, num)
+        self.grid.add_blocks(new_blocks)
         self.block_count = next_num
         if self.count_spinbox:
-            self.count_spinbox.setValue(len(self.grid.blocks))
+            self._set_count_spinbox(len(self.grid.blocks))
         self.status_label.setText(f"Mirrored vertically. Total blocks: {len(self.grid.blocks)}")
-        self.update_debug_log()
-        self.update_clipboard_pattern()
+        self._schedule_ui_refresh()
     
     # Blocklock methods
     def set_random_symbol(self):
         """Set a random symbol in the combo box"""
         if hasattr(self, 'symbol_combo'):
-            symbols = ['!', '@', '#', '$', '%', '^', '&', '*', '(', ')', '_', '+', '-', '=', '[', ']', '{', '}', '|', ';', ':', ',', '.', '<', '>', '?', '/', '~', '`', '"', "'", '\\']
-            random_symbol = random.choice(symbols)
-            index = self.symbol_combo.findText(random_symbol)
-            if index >= 0:
-                self.symbol_combo.setCurrentIndex(index)
+            self.symbol_combo.setCurrentText(random.choice(_PORTAL_SYMBOLS))  # No-op if the symbol is not listed
     
     def generate_gate_from_glyph(self):
         """Generate a GATE system from the current glyph"""
@@ -3002,8 +3090,7 @@ Security Notes:
         if hasattr(self, 'gate_display'):
             gate_data = self.gate_display.toPlainText()
             if gate_data:
-                clipboard = QApplication.clipboard()
-                clipboard.setText(gate_data)
+                self._clipboard.setText(gate_data)
                 self.log_debug("GATE data copied to clipboard")
             else:
                 self.log_debug("No GATE data to copy")
@@ -3077,11 +3164,7 @@ Verification: FAILED
     def set_random_portal_symbol(self):
         """Set a random symbol in the portal combo box"""
         if hasattr(self, 'portal_symbol_combo'):
-            symbols = ['!', '@', '#', '$', '%', '^', '&', '*', '(', ')', '_', '+', '-', '=', '[', ']', '{', '}', '|', ';', ':', ',', '.', '<', '>', '?', '/', '~', '`', '"', "'", '\\']
-            random_symbol = random.choice(symbols)
-            index = self.portal_symbol_combo.findText(random_symbol)
-            if index >= 0:
-                self.portal_symbol_combo.setCurrentIndex(index)
+            self.portal_symbol_combo.setCurrentText(random.choice(_PORTAL_SYMBOLS))  # No-op if the symbol is not listed
     
     def generate_gate_portal(self):
         """Generate a universal GATE portal code"""
@@ -3104,6 +3187,7 @@ Verification: FAILED
             # Generate portal using gate portal system
             portal = GatePortal()
             result = portal.generate_gate_portal(sigil_pattern, symbol, integration_type)
+            self._last_portal_code = result['portal_code']
             
             # Display the portal code
             if hasattr(self, 'portal_display'):
@@ -3147,22 +3231,9 @@ This portal code can be used across any compatible system."""
     def copy_gate_portal(self):
         """Copy the generated portal code to clipboard"""
         if hasattr(self, 'portal_display'):
-            portal_text = self.portal_display.toPlainText()
-            if portal_text:
-                # Extract just the portal code
-                lines = portal_text.split('\n')
-                portal_code = None
-                for line in lines:
-                    if line.startswith('Portal Code:'):
-                        portal_code = line.split(':', 1)[1].strip()
-                        break
-                
-                if portal_code:
-                    clipboard = QApplication.clipboard()
-                    clipboard.setText(portal_code)
-                    self.log_debug("GATE portal code copied to clipboard")
-                else:
-                    self.log_debug("No portal code found to copy")
+            if self._last_portal_code:
+                self._clipboard.setText(self._last_portal_code)
+                self.log_debug("GATE portal code copied to clipboard")
             else:
                 self.log_debug("No portal code to copy")
         else:
@@ -3172,35 +3243,13 @@ This portal code can be used across any compatible system."""
         """Generate ASCII pattern from a grid instance"""
         if not grid or not grid.blocks:
             return ""
-            
-        min_row = min(pos[0] for pos in grid.blocks.keys())
-        max_row = max(pos[0] for pos in grid.blocks.keys())
-        min_col = min(pos[1] for pos in grid.blocks.keys())
-        max_col = max(pos[1] for pos in grid.blocks.keys())
-        
-        pattern_lines = []
-        for row in range(min_row, max_row + 1):
-            line = ""
-            for col in range(min_col, max_col + 1):
-                if (row, col) in grid.blocks:
-                    block_num = grid.blocks[(row, col)]
-                    if block_num == -999:
-                        line += ". "  # treat flash as empty
-                    elif block_num == 1:
-                        line += "+ "
-                    else:
-                        line += f"{block_num} "
-                else:
-                    line += ". "
-            pattern_lines.append(line.rstrip())
-        
-        return "\n".join(pattern_lines)
+        return "\n".join(_pattern_rows(grid.blocks))
     
     def generate_unique_piece(self):
         """Generate a unique piece using the unique grid"""
         try:
             # Get grid pattern
-            if not self.unique_grid.blocks:
+            if not self.unique_grid or not self.unique_grid.blocks:
                 self.unique_preview_text.setPlainText("Error: Grid is empty. Create blocks first!")
                 return
                 
@@ -3210,8 +3259,8 @@ This portal code can be used across any compatible system."""
                 self.unique_preview_text.setPlainText("Error: Grid is empty. Create blocks first!")
                 return
                 
-            # Count blocks (including + symbol)
-            block_count = sum(1 for char in pattern if char.isdigit() or char == '+')
+            # Count blocks straight from the grid (digit counting overcounted 10+)
+            block_count = len(self.unique_grid.blocks)
             if block_count == 0:
                 self.unique_preview_text.setPlainText("Error: No blocks in grid!")
                 return
@@ -3231,12 +3280,7 @@ This portal code can be used across any compatible system."""
             preview_text += f"Blocks: {block_count}\n"
             
             # Only show the active stat
-            active_stat = None
-            for stat_name, stat_value in piece['stats'].items():
-                if stat_value > 0:
-                    active_stat = (stat_name.upper(), stat_value)
-                    break
-                    
+            active_stat = _find_active_stat(piece['stats'])
             if active_stat:
                 preview_text += f"Stats: {active_stat[0]}:{active_stat[1]}\n"
             else:
@@ -3255,7 +3299,7 @@ This portal code can be used across any compatible system."""
         """Export the unique piece with icon generation"""
         try:
             # Get grid pattern
-            if not self.unique_grid.blocks:
+            if not self.unique_grid or not self.unique_grid.blocks:
                 self.unique_preview_text.setPlainText("Error: Grid is empty. Create blocks first!")
                 return
                 
@@ -3266,7 +3310,7 @@ This portal code can be used across any compatible system."""
                 return
                 
             # Count blocks
-            block_count = sum(1 for char in pattern if char.isdigit() or char == '+')
+            block_count = len(self.unique_grid.blocks)
             if block_count == 0:
                 self.unique_preview_text.setPlainText("Error: No blocks in grid!")
                 return
@@ -13,12 +13,32 @@ import hashlib
 import random
 import json
 import os
+from collections import OrderedDict
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+
+# Derived keys, keyed by digests of (glyph_pattern, password) so neither is held
+# in the clear. Shared across GateCreator instances since callers make a fresh one
+# per operation; least recently used keys are dropped past _KEY_CACHE_SIZE.
+_KEY_CACHE: "OrderedDict[Tuple[bytes, bytes], bytes]" = OrderedDict()
+_KEY_CACHE_SIZE = 128
+
+# AES-GCM contexts per derived key, so the key schedule is expanded once per key
+_AEAD_CACHE: "OrderedDict[bytes, AESGCM]" = OrderedDict()
+
+
+def _aesgcm_for_key(key: bytes) -> AESGCM:
+    """Return a cached AESGCM for a derived key, same LRU bound as _KEY_CACHE"""
+    aesgcm = _AEAD_CACHE.get(key)
+    if aesgcm is None:
+        aesgcm = _AEAD_CACHE[key] = AESGCM(key)
+        if len(_AEAD_CACHE) > _KEY_CACHE_SIZE:
+            _AEAD_CACHE.popitem(last=False)
+    else:
+        _AEAD_CACHE.move_to_end(key)
+    return aesgcm
 
 
 @dataclass
@@ -72,8 +92,12 @@ class GateCreator:
         # Create the GLYPH KEY (key derivation source)
         glyph_key = self._create_glyph_key(glyph_data, password)
         
+        # Complexity metrics walk every block, so work them out once for both
+        # the lock and the summary below
+        metrics = self._calculate_complexity_metrics(glyph_data)
+        
         # Create the GATE LOCK (visual verification)
-        gate_lock = self._create_gate_lock(glyph_data, glyph_pattern)
+        gate_lock = self._create_gate_lock(glyph_data, glyph_pattern, metrics)
         
         return {
             'glyph_key': glyph_key,
@@ -81,7 +105,7 @@ class GateCreator:
             'metadata': {
                 'block_count': glyph_data['block_count'],
                 'grid_size': glyph_data['grid_size'],
-                'complexity_score': self._calculate_complexity_score(glyph_data),
+                'complexity_score': metrics['spatial_complexity'],
                 'complexity': self._assess_quantum_resistance(glyph_data)
             }
         }
@@ -104,18 +128,11 @@ class GateCreator:
         # Generate random IV for AES-GCM
         iv = os.urandom(12)  # 96 bits for GCM
         
-        # Create AES-GCM cipher
-        cipher = Cipher(algorithms.AES(key), modes.GCM(iv), backend=default_backend())
-        encryptor = cipher.encryptor()
-        
-        # Encrypt the data
-        ciphertext = encryptor.update(data) + encryptor.finalize()
-        
-        # Get authentication tag
-        tag = encryptor.tag
+        # Encrypt the data; AESGCM returns ciphertext + 16-byte tag
+        sealed = _aesgcm_for_key(key).encrypt(iv, data, None)
         
-        # Combine IV + tag + ciphertext
-        return iv + tag + ciphertext
+        # Combine IV + tag + ciphertext (the stored layout puts the tag first)
+        return iv + sealed[-16:] + sealed[:-16]
     
     def unlock_data(self, encrypted_data: bytes, glyph_pattern: str, password: str) -> bytes:
         """
@@ -137,12 +154,8 @@ class GateCreator:
         tag = encrypted_data[12:28]  # 16 bytes for GCM tag
         ciphertext = encrypted_data[28:]
         
-        # Create AES-GCM cipher for decryption
-        cipher = Cipher(algorithms.AES(key), modes.GCM(iv, tag), backend=default_backend())
-        decryptor = cipher.decryptor()
-        
-        # Decrypt the data
-        plaintext = decryptor.update(ciphertext) + decryptor.finalize()
+        # Decrypt and verify the data (raises InvalidTag on a wrong key or tampering)
+        plaintext = _aesgcm_for_key(key).decrypt(iv, ciphertext + tag, None)
         
         return plaintext
     
@@ -151,7 +164,18 @@ class GateCreator:
         Derive a cryptographic key from glyph spatial properties + password.
         
         This is where the glyph's uniqueness provides entropy for key generation.
+        Results are memoized, so repeated lock/unlock calls with the same glyph
+        and password skip the parse and the 100k PBKDF2 rounds.
         """
+        cache_key = (
+            hashlib.blake2b(glyph_pattern.encode(), digest_size=16).digest(),
+            hashlib.blake2b(password.encode(), digest_size=16).digest()
+        )
+        key = _KEY_CACHE.get(cache_key)
+        if key is not None:
+            _KEY_CACHE.move_to_end(cache_key)
+            return key
+        
         # Extract spatial entropy from glyph
         glyph_data = self._parse_glyph_structure(glyph_pattern)
         spatial_entropy = self._extract_spatial_entropy(glyph_data)
@@ -159,19 +183,22 @@ class GateCreator:
         # Combine glyph entropy with password
         combined_entropy = spatial_entropy + password.encode()
         
-        # Use PBKDF2 for key derivation (256-bit key for AES-256)
+        # Use PBKDF2 for key derivation (256-bit key for AES-256). hashlib's
+        # OpenSSL-backed pbkdf2_hmac gives the same bytes as the cryptography
+        # PBKDF2HMAC object without building it per call. The KDF itself (and the
+        # fixed salt) must stay as is, or existing gates could no longer be unlocked.
         salt = b'gate_creator_salt'  # Fixed salt for deterministic key derivation
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,  # 256 bits
-            salt=salt,
-            iterations=100000,  # High iteration count for security
-            backend=default_backend()
+        key = hashlib.pbkdf2_hmac(
+            'sha256',
+            combined_entropy,
+            salt,
+            100000,  # High iteration count for security
+            dklen=32  # 256 bits
         )
         
-        # Generate the master key
-        key = kdf.derive(combined_entropy)
-        
+        _KEY_CACHE[cache_key] = key
+        if len(_KEY_CACHE) > _KEY_CACHE_SIZE:
+            _KEY_CACHE.popitem(last=False)
         return key
     
     def _extract_spatial_entropy(self, glyph_data: Dict[str, Any]) -> bytes:
@@ -181,48 +208,35 @@ class GateCreator:
         This converts the glyph's unique spatial properties into entropy
         for key derivation.
         """
-        # Create entropy from spatial properties
-        entropy_parts = []
+        # Fragments go straight into the hash. The byte stream feeds every derived
+        # key, so its content and order must not change.
+        entropy = hashlib.sha256()
+        update = entropy.update
         
         # 1. Block positions as entropy
         for row, col, block_num in sorted(glyph_data['blocks'], key=lambda x: x[2]):
-            entropy_parts.append(f"{row},{col},{block_num}".encode())
+            update(f"{row},{col},{block_num}".encode())
         
-        # 2. Adjacency relationships as entropy
+        # 2. Adjacency relationships as entropy (the map has one entry per block,
+        # so the rows/columns for step 4 are collected on the same pass)
+        rows = set()
+        cols = set()
         for pos, adjacent in glyph_data['adjacency_map'].items():
             row, col = pos
-            adj_str = f"{row},{col}:{len(adjacent)}"
-            entropy_parts.append(adj_str.encode())
-        
-        # 3. Grid density patterns as entropy
-        grid_size = glyph_data['grid_size']
-        density_map = {}
-        for row in range(grid_size):
-            for col in range(grid_size):
-                if (row, col) in glyph_data['blocks']:
-                    # Count filled neighbors
-                    filled_neighbors = 0
-                    for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                        if (row + dr, col + dc) in glyph_data['blocks']:
-                            filled_neighbors += 1
-                    density_map[(row, col)] = filled_neighbors
-        
-        # Add density entropy
-        for pos, density in density_map.items():
-            row, col = pos
-            entropy_parts.append(f"density:{row},{col}:{density}".encode())
+            rows.add(row)
+            cols.add(col)
+            update(f"{row},{col}:{len(adjacent)}".encode())
         
-        # 4. Spatial distribution patterns
-        positions = [(row, col) for row, col, _ in glyph_data['blocks']]
-        row_distribution = len(set(row for row, _ in positions))
-        col_distribution = len(set(col for _, col in positions))
-        entropy_parts.append(f"dist:{row_distribution},{col_distribution}".encode())
+        # 3. Grid density patterns contribute nothing: the original scan tested
+        # (row, col) pairs against the (row, col, block_num) block list, which never
+        # matches. Adding real density bytes would change every key, so the grid
+        # scan is simply not run.
         
-        # Combine all entropy parts
-        combined_entropy = b''.join(entropy_parts)
+        # 4. Spatial distribution patterns
+        update(f"dist:{len(rows)},{len(cols)}".encode())
         
         # Hash to create consistent entropy
-        return hashlib.sha256(combined_entropy).digest()
+        return entropy.digest()
     
     def _parse_glyph_structure(self, glyph_pattern: str) -> Dict[str, Any]:
         """Parse glyph into spatial structure with exact positions"""
@@ -238,20 +252,18 @@ class GateCreator:
             'adjacency_map': {}  # Maps each block to its adjacent blocks
         }
         
-        # Parse each line
+        # Parse each line; counts and the max are taken once the blocks are in
+        blocks = spatial_data['blocks']
+        add_block = blocks.append
         for row, line in enumerate(lines):
-            parts = line.strip().split()
-            for col, part in enumerate(parts):
+            for col, part in enumerate(line.split()):
                 if part == '+':
                     spatial_data['anchor_pos'] = (row, col)
-                    spatial_data['blocks'].append((row, col, 1))
-                    spatial_data['block_count'] += 1
-                    spatial_data['max_number'] = max(spatial_data['max_number'], 1)
+                    add_block((row, col, 1))
                 elif part.isdigit():
-                    number = int(part)
-                    spatial_data['blocks'].append((row, col, number))
-                    spatial_data['block_count'] += 1
-                    spatial_data['max_number'] = max(spatial_data['max_number'], number)
+                    add_block((row, col, int(part)))
+        spatial_data['block_count'] = len(blocks)
+        spatial_data['max_number'] = max((number for _, _, number in blocks), default=0)
         
         # Build adjacency map
         spatial_data['adjacency_map'] = self._build_adjacency_map(spatial_data['blocks'])
@@ -261,12 +273,13 @@ class GateCreator:
     def _build_adjacency_map(self, blocks: List[Tuple[int, int, int]]) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
         """Build adjacency map for all blocks"""
         adjacency_map = {}
+        occupied = {(row, col) for row, col, _ in blocks}  # O(1) neighbour lookups
         
         for row, col, number in blocks:
             adjacent = []
             for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
                 new_row, new_col = row + dr, col + dc
-                if any(b[0] == new_row and b[1] == new_col for b in blocks):
+                if (new_row, new_col) in occupied:
                     adjacent.append((new_row, new_col))
             adjacency_map[(row, col)] = adjacent
         
@@ -300,8 +313,11 @@ class GateCreator:
         
         return glyph_key
     
-    def _create_gate_lock(self, glyph_data: Dict[str, Any], glyph_pattern: str) -> GateLock:
+    def _create_gate_lock(self, glyph_data: Dict[str, Any], glyph_pattern: str,
+                          metrics: Optional[Dict[str, Any]] = None) -> GateLock:
         """Create the GATE LOCK (visual verification pattern)"""
+        if metrics is None:
+            metrics = self._calculate_complexity_metrics(glyph_data)
         
         # Create verification hash from visual pattern
         verification_hash = hashlib.sha256(glyph_pattern.encode()).hexdigest()[:32]
@@ -312,7 +328,7 @@ class GateCreator:
             'grid_size': glyph_data['grid_size'],
             'max_number': glyph_data['max_number'],
             'anchor_position': glyph_data['anchor_pos'],
-            'complexity_metrics': self._calculate_complexity_metrics(glyph_data)
+            'complexity_metrics': metrics
         }
         
         # Create the gate lock
@@ -320,7 +336,7 @@ class GateCreator:
             visual_pattern=glyph_pattern,
             verification_hash=verification_hash,
             metadata=metadata,
-            glyph_complexity=self._calculate_complexity_metrics(glyph_data)
+            glyph_complexity=dict(metrics)  # Separate dict from metadata['complexity_metrics']
         )
         
         return gate_lock
@@ -364,9 +380,9 @@ class GateCreator:
         avg_adjacency = sum(len(adj) for adj in glyph_data['adjacency_map'].values()) / glyph_data['block_count']
         
         # Distribution complexity
-        positions = [(row, col) for row, col, _ in glyph_data['blocks']]
-        row_distribution = len(set(row for row, _ in positions)) / glyph_data['grid_size']
-        col_distribution = len(set(col for _, col in positions)) / glyph_data['grid_size']
+        blocks = glyph_data['blocks']
+        row_distribution = len({row for row, _, _ in blocks}) / glyph_data['grid_size']
+        col_distribution = len({col for _, col, _ in blocks}) / glyph_data['grid_size']
         
         return {
             'density': density,
@@ -376,11 +392,6 @@ class GateCreator:
             'spatial_complexity': density * avg_adjacency * (row_distribution + col_distribution)
         }
     
-    def _calculate_complexity_score(self, glyph_data: Dict[str, Any]) -> float:
-        """Calculate overall complexity score"""
-        metrics = self._calculate_complexity_metrics(glyph_data)
-        return metrics['spatial_complexity']
-    
     def _assess_quantum_resistance(self, glyph_data: Dict[str, Any]) -> Dict[str, Any]:
         """Assess complexity of the glyph"""
         